@@ -35,6 +35,7 @@ from src.ui_components import Panel, ProgressBar, UIColors
 from src.ui import hud as ui_hud
 from src import ui_shop
 from src import factions
+from src import enemy_sprites
 from src.ui import hud as hud_module
 from src.ui import menus
 from src.resource_manager import get_font, Fonts
@@ -100,6 +101,8 @@ def main():
     init_fonts()  # Pre-create fonts once for performance
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Mount & Blade 2D RPG - MVP B")
+    # Load enemy sprite sheets now so the first battle with a new type doesn't hitch
+    enemy_sprites.preload_enemy_sprites()
     clock = pygame.time.Clock()
 
     # Initialize transition manager for smooth state changes
@@ -143,7 +146,7 @@ def main():
         player_troops = []
         world = world_mod.init_world(rng_seed)
         player.equipment = equip_mod.Equipment()
-        player.inventory = []
+        player.inventory = items.ItemList()
         player_relations = entities.FactionRelations()
         food_timer = time.time()
         last_battle_faction = None
@@ -947,10 +950,10 @@ def main():
                             from src import factions as _fx
                             thr = _fx.get_faction('thrace') or {}
                             thr_keys = set((thr.get('shop_weights') or {}).keys())
-                            t1_weapons = [k for k, v in _itdb.ITEM_DATABASE.items() if k in thr_keys and v.get('tier',1)==1 and ('damage' in v or 'defense' in v)]
+                            t1_weapons = [k for k, v in _itdb.ITEM_DATABASE.items() if k in thr_keys and v.tier==1 and v.kind != _itdb.KIND_CONSUMABLE]
                             import random as _r
-                            for k in _r.sample(t1_weapons, min(8, len(t1_weapons))):
-                                SHOP_INVENTORY.append(_itdb.get_item_by_id(k, with_random_quality=True))
+                            SHOP_INVENTORY.extend(_itdb.get_random_quality_items(
+                                _r.sample(t1_weapons, min(8, len(t1_weapons)))))
                 except Exception:
                     pass
 
@@ -1016,9 +1019,9 @@ def main():
 
             # Facção da loja: título colorido
             try:
-                fac = factions.get_faction(CURRENT_SHOP_FACTION_ID)
-                fac_name = fac.get('name', CURRENT_SHOP_FACTION_ID) if fac else CURRENT_SHOP_FACTION_ID
-                color = fac.get('palette', {}).get('primary', (255,255,255)) if fac else (255,255,255)
+                fac = factions.FACTION_VIEWS.get(CURRENT_SHOP_FACTION_ID)
+                fac_name = fac.name if fac else CURRENT_SHOP_FACTION_ID
+                color = (fac.primary or (255,255,255)) if fac else (255,255,255)
             except Exception:
                 fac_name = CURRENT_SHOP_FACTION_ID
                 color = (255,255,255)
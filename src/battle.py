@@ -33,10 +33,9 @@ from src import battle_combat
 from src import battle_arena
 from src import battle_orders
 from src import battle_input
-from src.constants_battle import PLAYER_HEAVY_ATTACK_MOVE_MULT
-
-
-# Battle arena constants (sync with global constants)\nfrom src.constants import ARENA_WIDTH as GLOBAL_ARENA_WIDTH, ARENA_HEIGHT as GLOBAL_ARENA_HEIGHT\nARENA_WIDTH = GLOBAL_ARENA_WIDTH\nARENA_HEIGHT = GLOBAL_ARENA_HEIGHT\nARENA_BORDER = 40
+from src.constants_battle import PLAYER_HEAVY_ATTACK_MOVE_MULT, make_attack_range_fn
+from src.constants_core import ARENA_WIDTH, ARENA_HEIGHT, ARENA_BORDER
+from src.constants_enums import ArmorMat
 
 
 class BattleController:
@@ -71,6 +70,14 @@ class BattleController:
         for i, e in enumerate(self.enemies):
             print(f"  Enemy {i}: {e.name if hasattr(e, 'name') else 'UNNAMED'} at pos {e.pos}")
 
+        # Player swing reach: radius + clamped weapon range (no flat bonus)
+        self.player_attack_range = make_attack_range_fn(self.player.radius, base_range=0.0)
+
+        # Armor material code per enemy, aligned with self.enemies (gear is fixed for the battle)
+        self.enemy_armor_mats = tuple(
+            e.equipment.get_primary_armor_mat() if e.equipment else ArmorMat.LEATHER for e in self.enemies
+        )
+
         # Battle state
         self._done = False
         self._victory = False
@@ -551,7 +558,7 @@ class BattleController:
                 if block_timer <= 0.0:
                     # Check if player is attacking toward this enemy
                     player_attacking = self.player_attack_duration > 0.0
-                    close_to_player = entities.distance(enemy, self.player) < 120
+                    close_to_player = entities.dist_sq(enemy, self.player) < 120 * 120
 
                     if player_attacking and close_to_player:
                         # Check attack direction (is player attacking toward this enemy?)
@@ -8,17 +8,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Tuple
 import math
 from src import entities, vfx
+from src.constants_core import ARENA_WIDTH, ARENA_HEIGHT, ARENA_BORDER
 
 if TYPE_CHECKING:
     from src.battle import BattleController
     from src.entities import Entity
 
-# Constants
-ARENA_WIDTH = 1280
-ARENA_HEIGHT = 720
-ARENA_BORDER = 40
-
-
 def calculate_target_priority(battle: 'BattleController', enemy: 'Entity') -> Optional['Entity']:
     """Calculate best target for enemy using priority scoring system.
 
@@ -99,7 +94,7 @@ def update_blocking_decision(battle: 'BattleController', enemy: 'Entity', dt: fl
     if block_timer <= 0.0:
         # Check if player is attacking toward this enemy
         player_attacking = battle.player_attack_duration > 0.0
-        close_to_player = entities.distance(enemy, battle.player) < 120
+        close_to_player = entities.dist_sq(enemy, battle.player) < 120 * 120
 
         if player_attacking and close_to_player:
             # Check attack direction (is player attacking toward this enemy?)
@@ -211,9 +206,9 @@ def calculate_enemy_movement(battle: 'BattleController', enemy: 'Entity', target
                 dy = target.pos[1] - enemy.pos[1]
 
         # SPACING: Avoid stacking on top of each other (check only nearby enemies for performance)
-        nearby_enemies = [e for e in battle.enemies if e.id != enemy.id and e.alive() and entities.distance(enemy, e) < 100]
+        nearby_enemies = [e for e in battle.enemies if e.id != enemy.id and e.alive() and entities.dist_sq(enemy, e) < 100 * 100]
         # Limit to 5 nearest to avoid O(n²) performance
-        nearby_enemies.sort(key=lambda e: entities.distance(enemy, e))
+        nearby_enemies.sort(key=lambda e: entities.dist_sq(enemy, e))
         for other_enemy in nearby_enemies[:5]:
             dist_to_other = entities.distance(enemy, other_enemy)
             if dist_to_other < 50:  # Too close to another enemy
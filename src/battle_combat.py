@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import math
 from src import entities, vfx, battle_effects
+from src.constants_enums import effectiveness_row
 from src.logger import get_logger
 
 logger = get_logger(__name__)
@@ -103,12 +104,15 @@ def apply_player_attack_damage(battle: 'BattleController') -> None:
 
     # Reach depends on equipped weapon range
     weapon = battle.player.equipment.get_weapon()
-    w_range = float(getattr(weapon, "range", 60.0))
-    attack_range = battle.player.radius + max(30.0, min(w_range, 110.0))
+    attack_range = battle.player_attack_range(weapon.range)
 
     combo_mult = battle._combo_multiplier()
 
-    for enemy in battle.enemies:
+    # Multipliers of this weapon's damage type, indexed by armor material
+    weapon_effectiveness = effectiveness_row(weapon.dmg_type)
+    enemy_armor_mats = battle.enemy_armor_mats
+
+    for enemy_idx, enemy in enumerate(battle.enemies):
         if not enemy.alive():
             continue
 
@@ -137,10 +141,7 @@ def apply_player_attack_damage(battle: 'BattleController') -> None:
         damage = (battle.player.stats.atk * weapon.damage) * combo_mult
 
         # DAMAGE TYPE EFFECTIVENESS: Apply multiplier based on weapon type vs armor material
-        from src.constants_battle import DAMAGE_TYPE_EFFECTIVENESS
-        weapon_damage_type = getattr(weapon, 'damage_type', 'slashing')
-        enemy_armor_material = enemy.equipment.get_primary_material() if enemy.equipment else "leather"
-        effectiveness = DAMAGE_TYPE_EFFECTIVENESS.get(weapon_damage_type, {}).get(enemy_armor_material, 1.0)
+        effectiveness = weapon_effectiveness[enemy_armor_mats[enemy_idx]]
         damage *= effectiveness
 
         # Track if damage was super effective or resisted (for visual feedback)
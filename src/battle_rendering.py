@@ -13,16 +13,11 @@ from src import vfx
 from src import battle_sprites
 from src import troop_sprites
 from src import enemy_sprites
-from src.constants import ARENA_WIDTH as GLOBAL_ARENA_WIDTH, ARENA_HEIGHT as GLOBAL_ARENA_HEIGHT
+from src.constants_core import ARENA_WIDTH, ARENA_HEIGHT, ARENA_BORDER
 
 if TYPE_CHECKING:
     from src.battle import BattleController
 
-# Constants (sync with global constants)
-ARENA_WIDTH = GLOBAL_ARENA_WIDTH
-ARENA_HEIGHT = GLOBAL_ARENA_HEIGHT
-ARENA_BORDER = 40
-
 # Arrow sprite cache
 _ARROW_SPRITES: dict[str, pygame.Surface] = {}
 
@@ -401,93 +396,23 @@ def render_entities(battle: 'BattleController', screen: pygame.Surface, shake_x:
     # Enemies
     # Get relations for faction-based coloring (may be None)
     relations = getattr(battle, 'player_relations', None)
+    # One tick read per frame, shared by every enemy's facing/animation update
+    now_ms = pygame.time.get_ticks()
 
+    # Pass 1: shadows and dead enemies; collect the living for the sprite batch
+    alive_enemies = []
+    alive_positions = []
     for enemy in battle.enemies:
+        enemy_pos_screen = (int(enemy.pos[0] + shake_x), int(enemy.pos[1] + shake_y))
+        vfx.draw_entity_shadow(screen, enemy_pos_screen, enemy.radius)
         if enemy.alive():
-            enemy_pos_screen = (int(enemy.pos[0] + shake_x), int(enemy.pos[1] + shake_y))
-            vfx.draw_entity_shadow(screen, enemy_pos_screen, enemy.radius)
-
             # Update facing direction
             prev_pos = battle.prev_positions.get(enemy.id)
-            enemy_sprites.update_enemy_facing(enemy, prev_pos)
-
-            # Check states for visual effects
-            is_stunned = battle.enemy_stun_times.get(enemy.id, 0.0) > 0.0
-            is_blocking = battle.enemy_blocking_states.get(enemy.id, False)
-
-            # Try to render sprite; fallback to circle if not available
-            drawn = enemy_sprites.draw_enemy_sprite(enemy, screen, enemy_pos_screen, relations)
-
-            if not drawn:
-                # Fallback: VARIED COLORS BY ENEMY TYPE
-                enemy_type = getattr(enemy, 'enemy_type', 'bandit')
-                if enemy_type == "bandit":
-                    color = (220, 80, 80)  # Red
-                elif enemy_type == "soldier":
-                    color = (100, 100, 180)  # Blue (kingdom colors)
-                elif enemy_type == "brute":
-                    color = (180, 100, 40)  # Brown/orange (berserker)
-                elif enemy_type == "beast":
-                    color = (140, 80, 140)  # Purple (monster)
-                else:
-                    color = (220, 80, 80)  # Default red
-
-                # Check if stunned (yellow tint)
-                is_stunned = battle.enemy_stun_times.get(enemy.id, 0.0) > 0.0
-                if is_stunned:
-                    color = (200, 200, 80)
-
-                # Darker tint when blocking
-                is_blocking = battle.enemy_blocking_states.get(enemy.id, False)
-                if is_blocking:
-                    color = tuple(int(c * 0.6) for c in color)  # Darken by 40%
-
-                # Flash when invulnerable
-                if enemy._invuln > 0:
-                    flash = int((enemy._invuln / 0.3) * 150)
-                    color = (min(255, 220 + flash // 2), min(255, 80 + flash), min(255, 80 + flash))
-
-                pygame.draw.circle(screen, color, enemy_pos_screen, int(enemy.radius))
-
-            # IMPROVED BLOCKING VISUAL - much more obvious!
-            if is_blocking:
-                # Multiple bright blue shield rings
-                for ring_offset in range(0, 20, 5):
-                    ring_radius = enemy.radius + 8 + ring_offset
-                    pygame.draw.circle(screen, (100, 200, 255), enemy_pos_screen, ring_radius, 3)
-
-                # Bright blue glow effect
-                shield_surf = pygame.Surface((enemy.radius * 3, enemy.radius * 3), pygame.SRCALPHA)
-                pygame.draw.circle(shield_surf, (100, 200, 255, 80),
-                                 (enemy.radius * 1.5, enemy.radius * 1.5), enemy.radius + 10)
-                screen.blit(shield_surf, (enemy_pos_screen[0] - enemy.radius * 1.5,
-                                         enemy_pos_screen[1] - enemy.radius * 1.5))
-
-                # "BLOCKING" text above enemy
-                font = pygame.font.Font(None, 18)
-                block_text = font.render("BLOCKING", True, (100, 220, 255))
-                text_pos = (enemy_pos_screen[0] - 30, enemy_pos_screen[1] - 50)
-                screen.blit(block_text, text_pos)
-
-            # Stars when stunned
-            if is_stunned:
-                star_y = int(enemy.pos[1] + shake_y - enemy.radius - 15)
-                pygame.draw.circle(screen, (255, 255, 100), (int(enemy.pos[0] + shake_x - 10), star_y), 3)
-                pygame.draw.circle(screen, (255, 255, 100), (int(enemy.pos[0] + shake_x + 10), star_y), 3)
-
-            # Enemy HP bar
-            hp_ratio = enemy.stats.hp / enemy.stats.hp_max
-            bar_width = 40
-            bar_height = 4
-            bar_x = int(enemy.pos[0] + shake_x - bar_width // 2)
-            bar_y = int(enemy.pos[1] + shake_y - enemy.radius - 10)
-            pygame.draw.rect(screen, (40, 40, 40), pygame.Rect(bar_x, bar_y, bar_width, bar_height))
-            pygame.draw.rect(screen, (200, 50, 50), pygame.Rect(bar_x, bar_y, int(bar_width * hp_ratio), bar_height))
+            enemy_sprites.update_enemy_facing(enemy, prev_pos, now_ms)
+            alive_enemies.append(enemy)
+            alive_positions.append(enemy_pos_screen)
         else:
             # Dead enemy (dark red X)
-            enemy_pos_screen = (int(enemy.pos[0] + shake_x), int(enemy.pos[1] + shake_y))
-            vfx.draw_entity_shadow(screen, enemy_pos_screen, enemy.radius)
-
             pygame.draw.circle(screen, (60, 20, 20), enemy_pos_screen, int(enemy.radius))
             # Draw X
             size = enemy.radius * 0.7
@@ -495,6 +420,80 @@ def render_entities(battle: 'BattleController', screen: pygame.Surface, shake_x:
             pygame.draw.line(screen, (100, 40, 40), (cx - size, cy - size), (cx + size, cy + size), 3)
             pygame.draw.line(screen, (100, 40, 40), (cx - size, cy + size), (cx + size, cy - size), 3)
 
+    # Pass 2: living enemy sprites in one batched blit (fallback circle if not available)
+    sprite_drawn = enemy_sprites.draw_enemies_batch(alive_enemies, alive_positions, screen, relations, now_ms)
+
+    # Pass 3: fallback shapes, status effects and HP bars on top of every sprite
+    for enemy, enemy_pos_screen, drawn in zip(alive_enemies, alive_positions, sprite_drawn):
+        # Check states for visual effects
+        is_stunned = battle.enemy_stun_times.get(enemy.id, 0.0) > 0.0
+        is_blocking = battle.enemy_blocking_states.get(enemy.id, False)
+
+        if not drawn:
+            # Fallback: VARIED COLORS BY ENEMY TYPE
+            enemy_type = getattr(enemy, 'enemy_type', 'bandit')
+            if enemy_type == "bandit":
+                color = (220, 80, 80)  # Red
+            elif enemy_type == "soldier":
+                color = (100, 100, 180)  # Blue (kingdom colors)
+            elif enemy_type == "brute":
+                color = (180, 100, 40)  # Brown/orange (berserker)
+            elif enemy_type == "beast":
+                color = (140, 80, 140)  # Purple (monster)
+            else:
+                color = (220, 80, 80)  # Default red
+
+            # Check if stunned (yellow tint)
+            is_stunned = battle.enemy_stun_times.get(enemy.id, 0.0) > 0.0
+            if is_stunned:
+                color = (200, 200, 80)
+
+            # Darker tint when blocking
+            is_blocking = battle.enemy_blocking_states.get(enemy.id, False)
+            if is_blocking:
+                color = tuple(int(c * 0.6) for c in color)  # Darken by 40%
+
+            # Flash when invulnerable
+            if enemy._invuln > 0:
+                flash = int((enemy._invuln / 0.3) * 150)
+                color = (min(255, 220 + flash // 2), min(255, 80 + flash), min(255, 80 + flash))
+
+            pygame.draw.circle(screen, color, enemy_pos_screen, int(enemy.radius))
+
+        # IMPROVED BLOCKING VISUAL - much more obvious!
+        if is_blocking:
+            # Multiple bright blue shield rings
+            for ring_offset in range(0, 20, 5):
+                ring_radius = enemy.radius + 8 + ring_offset
+                pygame.draw.circle(screen, (100, 200, 255), enemy_pos_screen, ring_radius, 3)
+
+            # Bright blue glow effect
+            shield_surf = pygame.Surface((enemy.radius * 3, enemy.radius * 3), pygame.SRCALPHA)
+            pygame.draw.circle(shield_surf, (100, 200, 255, 80),
+                             (enemy.radius * 1.5, enemy.radius * 1.5), enemy.radius + 10)
+            screen.blit(shield_surf, (enemy_pos_screen[0] - enemy.radius * 1.5,
+                                     enemy_pos_screen[1] - enemy.radius * 1.5))
+
+            # "BLOCKING" text above enemy
+            font = pygame.font.Font(None, 18)
+            block_text = font.render("BLOCKING", True, (100, 220, 255))
+            text_pos = (enemy_pos_screen[0] - 30, enemy_pos_screen[1] - 50)
+            screen.blit(block_text, text_pos)
+
+        # Stars when stunned
+        if is_stunned:
+            star_y = int(enemy.pos[1] + shake_y - enemy.radius - 15)
+            pygame.draw.circle(screen, (255, 255, 100), (int(enemy.pos[0] + shake_x - 10), star_y), 3)
+            pygame.draw.circle(screen, (255, 255, 100), (int(enemy.pos[0] + shake_x + 10), star_y), 3)
+
+        # Enemy HP bar
+        hp_ratio = enemy.stats.hp / enemy.stats.hp_max
+        bar_width = 40
+        bar_height = 4
+        bar_x = int(enemy.pos[0] + shake_x - bar_width // 2)
+        bar_y = int(enemy.pos[1] + shake_y - enemy.radius - 10)
+        pygame.draw.rect(screen, (40, 40, 40), pygame.Rect(bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(screen, (200, 50, 50), pygame.Rect(bar_x, bar_y, int(bar_width * hp_ratio), bar_height))
 
 def render_troops(battle: 'BattleController', screen: pygame.Surface, shake_x: int, shake_y: int) -> None:
     """Render allied troops.
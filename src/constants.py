@@ -127,8 +127,7 @@ ITEM_DROP_CHANCE = 0.15  # 15% chance per enemy
 # ============================================================================
 # BATTLE ARENA
 # ============================================================================
-ARENA_WIDTH = 1920
-ARENA_HEIGHT = 1080
+from .constants_core import ARENA_WIDTH, ARENA_HEIGHT  # noqa: E402
 
 # ============================================================================
 # AI BEHAVIOR
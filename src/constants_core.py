@@ -0,0 +1,25 @@
+"""Core constants shared across the battle, world and UI modules.
+
+Values here used to be defined separately in several modules and had
+drifted apart; import them from this module instead of redefining them.
+"""
+
+from typing import Final
+
+# =============================================================================
+# ARENA DIMENSIONS
+# =============================================================================
+# The battle arena fills the game window (see constants.SCREEN_WIDTH/HEIGHT)
+ARENA_WIDTH: Final = 1920
+ARENA_HEIGHT: Final = 1080
+ARENA_BORDER: Final = 40
+
+# =============================================================================
+# MOVEMENT & PHYSICS
+# =============================================================================
+
+# Diagonal Movement Normalization
+DIAGONAL_MOVEMENT_FACTOR: Final[float] = 0.7071067811865475  # 1/sqrt(2), for 45° angles
+
+# Entity Radius
+DEFAULT_ENTITY_RADIUS: Final = 15  # default if not specified
@@ -0,0 +1,59 @@
+"""Integer-coded enums for combat lookups.
+
+Damage types and armor materials are stored as strings in the equipment
+databases; these IntEnums give them small integer codes so the damage
+effectiveness table can be indexed directly instead of hashed.
+"""
+
+from enum import IntEnum
+
+from .constants_battle import DAMAGE_TYPE_EFFECTIVENESS
+
+
+class DamageType(IntEnum):
+    SLASHING = 0
+    PIERCING = 1
+    BLUDGEONING = 2
+
+
+class ArmorMat(IntEnum):
+    LEATHER = 0
+    BRONZE = 1
+    CHAINMAIL = 2
+    PLATE = 3
+
+
+# String name -> enum (names match the keys used in the equipment databases)
+DAMAGE_TYPE_BY_NAME = {dt.name.lower(): dt for dt in DamageType}
+ARMOR_MAT_BY_NAME = {am.name.lower(): am for am in ArmorMat}
+
+# _DMG_EFF_TABLE[damage_type][armor_mat] -> multiplier
+_DMG_EFF_TABLE = tuple(
+    tuple(DAMAGE_TYPE_EFFECTIVENESS[dt.name.lower()][am.name.lower()] for am in ArmorMat)
+    for dt in DamageType
+)
+
+
+def effectiveness(damage_type: int, armor_mat: int) -> float:
+    """Get damage multiplier for an integer-coded damage type vs armor material.
+
+    Args:
+        damage_type: DamageType code
+        armor_mat: ArmorMat code
+
+    Returns:
+        Effectiveness multiplier
+    """
+    return _DMG_EFF_TABLE[damage_type][armor_mat]
+
+
+def effectiveness_row(damage_type: int) -> tuple:
+    """Get the multipliers of one damage type against every armor material.
+
+    Args:
+        damage_type: DamageType code
+
+    Returns:
+        Tuple of multipliers indexed by ArmorMat code
+    """
+    return _DMG_EFF_TABLE[damage_type]
@@ -18,17 +18,86 @@ ENEMY_SPRITE_HEIGHT_PER_RADIUS = 6.0
 ENEMY_SPRITE_FOOT_OFFSET_PCT = 0.40
 
 _CACHE: dict[str, pygame.Surface] = {}
-_ENEMY_FACING_RIGHT: dict[int, bool] = {}
-_ENEMY_LAST_POS: dict[int, tuple[float, float]] = {}
-_ENEMY_LAST_FLIP_MS: dict[int, int] = {}
-_ENEMY_SIGN_STREAK: dict[int, int] = {}
-_ENEMY_LAST_POS: dict[int, tuple[float, float]] = {}
+
+
+class _EnemyDrawState:
+    """Per-enemy facing/animation state carried between frames."""
+
+    __slots__ = ('facing_right', 'last_pos', 'last_flip_ms', 'sign_streak')
+
+    def __init__(self):
+        self.facing_right = True
+        self.last_pos: tuple[float, float] | None = None
+        self.last_flip_ms = 0
+        self.sign_streak = 0
+
+
+# One entry per enemy id, so each update/draw does a single dict lookup
+_ENEMY_STATE: dict[int, _EnemyDrawState] = {}
 _FRAME_LIST_CACHE: dict[str, list[pygame.Surface]] = {}
+# Finished (scaled + flipped) surfaces with their foot anchor, keyed by
+# (source_key, target_h, facing_right)
+_SCALED_CACHE: dict[tuple, tuple[pygame.Surface, int, int]] = {}
+_SCALED_CACHE_MAX = 256
+# Sprite color by (faction, relation value)
+_COLOR_CACHE: dict[tuple[str, int], str] = {}
+
+# Map archetypes to sprite files (colored sets)
+_SPRITE_MAP = {
+    "melee": "Warrior/Warrior_Idle.png",
+    "warrior": "Warrior/Warrior_Idle.png",
+    "ranged": "Archer/Archer_Idle.png",
+    "archer": "Archer/Archer_Idle.png",
+    "tank": "Lancer/Lancer_Idle.png",
+    "cavalry": "Lancer/Lancer_Idle.png",
+    "lancer": "Lancer/Lancer_Idle.png",
+    "minotaur": "Minotaur/Minotaur_Idle.png",
+    "beast": "Minotaur/Minotaur_Idle.png",
+}
+
+# Map colors to folder names (kept for fallback)
+_COLOR_FOLDERS = {
+    "blue": "Blue Units",
+    "red": "Red Units",
+    "yellow": "Yellow Units",
+    "black": "Black Units",
+}
+
+# Visual diversification: faction-specific overrides (only for non-bandits)
+# choosing which ground unit uses Lancer vs Warrior.
+# Format: { (faction, enemy_type): 'lancer'|'warrior' }
+# Greeks/Macedon/Seleucid já têm phalangite/cataphract (tank → Lancer), hoplite/soldier (warrior)
+_DIVERSIFY = {
+    ('rome', 'soldier'): 'lancer',
+    ('rome', 'legionary'): 'warrior',
+    ('carthage', 'soldier'): 'lancer',
+    ('carthage', 'carthaginian'): 'warrior',
+    ('pontus', 'pontic_raider'): 'lancer',
+    ('pontus', 'soldier'): 'warrior',
+    ('maurya', 'maurya_spearman'): 'lancer',
+    ('maurya', 'soldier'): 'warrior',
+}
+
+# Full asset paths, built once instead of joined on every load
+_UNITS_DIR = os.path.join("Tiny Swords (Free Pack)", "Units")
+_PATHS = {
+    (folder, sprite_file): os.path.join(_UNITS_DIR, folder, sprite_file)
+    for folder in _COLOR_FOLDERS.values()
+    for sprite_file in set(_SPRITE_MAP.values())
+}
+# Minotaur_2 animation sheets: Idle.png, Walk.png, Attack.png, Hurt.png, Dead.png
+_MINOTAUR2_PATHS = {
+    anim_name: os.path.join(_UNITS_DIR, "Minotaur_2", f"{anim_name}.png")
+    for anim_name in ("Idle", "Walk", "Attack", "Hurt", "Dead")
+}
 
 
 def get_faction_color(enemy, relations) -> str:
     """Determine sprite color based on faction relations.
 
+    The result is stamped on the enemy together with the relations object
+    and its version, so it is only recomputed after relations change.
+
     Returns: "blue", "red", "yellow", or "black"
     """
     faction = getattr(enemy, 'faction', 'bandits')
@@ -39,16 +108,27 @@ def get_faction_color(enemy, relations) -> str:
 
     # Check relations
     if relations and hasattr(relations, 'relations'):
+        version = getattr(relations, 'version', None)
+        stamp = getattr(enemy, '_faction_color', None)
+        if stamp is not None and stamp[0] is relations and stamp[1] == version and stamp[2] == faction:
+            return stamp[3]
         try:
             rel_value = int(relations.relations.get(faction, 0))
+        except Exception:
+            return 'red'
+        key = (faction, rel_value)
+        color = _COLOR_CACHE.get(key)
+        if color is None:
             if rel_value > 30:
-                return 'blue'  # Allied
+                color = 'blue'  # Allied
             elif rel_value < -30:
-                return 'red'   # Hostile
+                color = 'red'   # Hostile
             else:
-                return 'black'  # Neutral
-        except Exception:
-            pass
+                color = 'black'  # Neutral
+            _COLOR_CACHE[key] = color
+        if version is not None:
+            enemy._faction_color = (relations, version, faction, color)
+        return color
 
     # Default to red for unknown
     return 'red'
@@ -64,50 +144,27 @@ def _load_enemy_sprite(color: str, archetype: str, enemy=None) -> pygame.Surface
     if archetype.lower() == "minotaur":
         # Use the Minotaur_2 folder as specified by the user
         # Files present: Idle.png, Walk.png, Attack.png, Hurt.png, Dead.png
-        path = os.path.join("Tiny Swords (Free Pack)", "Units", "Minotaur_2", "Idle.png")
-        try:
-            sheet = pygame.image.load(path).convert_alpha()
-            sw, sh = sheet.get_width(), sheet.get_height()
-            frames = load_spritesheet(path, sh, sh) or []
-            if len(frames) <= 1 and sw > 0:
-                fw = max(1, sw // 8)
-                frames = load_spritesheet(path, fw, sh, num_frames=8)
-            sprite = frames[0] if frames else None
-            _CACHE[key] = sprite
-            return sprite
-        except Exception:
-            _CACHE[key] = None
-            return None
+        frames = _get_minotaur_frames("Idle")
+        sprite = frames[0] if frames else None
+        _store_sprite(key, sprite)
+        return sprite
 
-    # Map archetypes to sprite files (colored sets)
-    sprite_map = {
-        "melee": "Warrior/Warrior_Idle.png",
-        "warrior": "Warrior/Warrior_Idle.png",
-        "ranged": "Archer/Archer_Idle.png",
-        "archer": "Archer/Archer_Idle.png",
-        "tank": "Lancer/Lancer_Idle.png",
-        "cavalry": "Lancer/Lancer_Idle.png",
-        "lancer": "Lancer/Lancer_Idle.png",
-        "minotaur": "Minotaur/Minotaur_Idle.png",
-        "beast": "Minotaur/Minotaur_Idle.png",
-    }
-
-    # Map colors to folder names (kept for fallback)
-    color_folders = {
-        "blue": "Blue Units",
-        "red": "Red Units",
-        "yellow": "Yellow Units",
-        "black": "Black Units",
-    }
-
     # Determine archetype robustly with enemy fields (troop_type has priority)
+    # create_enemy stores lowercased type names; faction is assigned later by
+    # the spawner, so it is lowercased once here
     a = archetype.lower()
+    fac = et = ''
     if enemy is not None:
-        tt = str(getattr(enemy, 'troop_type', '')).lower()
+        tt = getattr(enemy, '_troop_type_lc', None)
+        if tt is None:
+            tt = str(getattr(enemy, 'troop_type', '')).lower()
+        et = getattr(enemy, '_enemy_type_lc', None)
+        if et is None:
+            et = str(getattr(enemy, 'enemy_type', '')).lower()
+        fac = str(getattr(enemy, 'faction', '')).lower()
         if tt:
             a = tt
         else:
-            et = str(getattr(enemy, 'enemy_type', '')).lower()
             if 'minotaur' in et:
                 a = 'minotaur'
             elif 'archer' in et or 'bow' in et:
@@ -115,186 +172,265 @@ def _load_enemy_sprite(color: str, archetype: str, enemy=None) -> pygame.Surface
     # Visual diversification per faction/type: choose which ground unit uses Lancer vs Warrior
     sprite_key = a
     if enemy is not None and a == 'warrior':
-        fac = str(getattr(enemy, 'faction', '')).lower()
-        et = str(getattr(enemy, 'enemy_type', '')).lower()
-
-        # Faction-specific overrides (only for non-bandits)
-        # Format: { faction: { enemy_type: 'lancer'|'warrior' } }
-        DIVERSIFY = {
-            'rome': {
-                'soldier': 'lancer',
-                'legionary': 'warrior',
-            },
-            'carthage': {
-                'soldier': 'lancer',
-                'carthaginian': 'warrior',
-            },
-            'pontus': {
-                'pontic_raider': 'lancer',
-                'soldier': 'warrior',
-            },
-            'maurya': {
-                'maurya_spearman': 'lancer',
-                'soldier': 'warrior',
-            },
-            # Greeks/Macedon/Seleucid já têm phalangite/cataphract (tank → Lancer), hoplite/soldier (warrior)
-        }
-
         if fac != 'bandits':
-            choice = DIVERSIFY.get(fac, {}).get(et)
+            choice = _DIVERSIFY.get((fac, et))
             if choice == 'lancer':
                 sprite_key = 'lancer'
             elif choice == 'warrior':
                 sprite_key = 'warrior'
 
-    sprite_file = sprite_map.get(sprite_key, "Warrior/Warrior_Idle.png")
+    sprite_file = _SPRITE_MAP.get(sprite_key, "Warrior/Warrior_Idle.png")
     # Freeze color set by faction to match available assets:
     # - Bandits => Yellow Units
     # - Others => Red Units
     if enemy is not None:
-        fac = str(getattr(enemy, 'faction', '')).lower()
         color_folder = "Yellow Units" if fac == 'bandits' else "Red Units"
     else:
-        color_folder = color_folders.get(color.lower(), "Red Units")
-    path = os.path.join("Tiny Swords (Free Pack)", "Units", color_folder, sprite_file)
+        color_folder = _COLOR_FOLDERS.get(color.lower(), "Red Units")
+    frames = _get_sheet_frames(_PATHS[(color_folder, sprite_file)])
+
+    # Get first frame
+    sprite = frames[0] if frames else None
+    _store_sprite(key, sprite)
+    return sprite
+
+
+def preload_enemy_sprites() -> None:
+    """Load every enemy sprite sheet up front (call after the display is set).
+
+    Sheets are otherwise loaded on first draw, which hitches the frame in
+    which a new enemy type or color first appears.
+    """
+    for path in _PATHS.values():
+        _get_sheet_frames(path)
+    for anim_name in ("Idle", "Walk"):
+        _get_minotaur_frames(anim_name)
+
+
+def _enemy_state(eid: int) -> _EnemyDrawState:
+    """Get (creating on first use) the draw state for an enemy id."""
+    st = _ENEMY_STATE.get(eid)
+    if st is None:
+        st = _ENEMY_STATE[eid] = _EnemyDrawState()
+    return st
+
 
+def _get_sheet_frames(path: str) -> list[pygame.Surface]:
+    """Load (once) and return the frames of a sprite sheet, keyed by path."""
+    frames = _FRAME_LIST_CACHE.get(path)
+    if frames is not None:
+        return frames
     try:
         sheet = pygame.image.load(path).convert_alpha()
         sw, sh = sheet.get_width(), sheet.get_height()
-
         # Try square frames first
-        frames = load_spritesheet(path, sh, sh)
-
+        frames = load_spritesheet(path, sh, sh) or []
         # Fallback: assume 8 frames horizontally
         if len(frames) <= 1 and sw > 0:
             fw = max(1, sw // 8)
             frames = load_spritesheet(path, fw, sh, num_frames=8)
-
-        # Get first frame
-        sprite = frames[0] if frames else None
-        _CACHE[key] = sprite
-        return sprite
     except Exception:
-        _CACHE[key] = None
-        return None
+        frames = []
+    _FRAME_LIST_CACHE[path] = frames
+    return frames
 
 
-def update_enemy_facing(enemy, prev_pos: tuple[float, float] | None) -> None:
-    """Update facing with hysteresis to avoid jittery flipping."""
-    eid = enemy.id
+def _get_minotaur_frames(anim_name: str) -> list[pygame.Surface]:
+    """Return the Minotaur_2 frames for an animation (Idle, Walk, ...)."""
+    return _get_sheet_frames(_MINOTAUR2_PATHS[anim_name])
+
+
+def _store_sprite(key: str, sprite: pygame.Surface | None) -> None:
+    """Cache a loaded sprite and its mirrored copy (under key + "_flip")."""
+    _CACHE[key] = sprite
+    _CACHE[key + "_flip"] = pygame.transform.flip(sprite, True, False) if sprite else None
+
+
+def _sprite_height(enemy) -> int:
+    """On-screen sprite height for an enemy, snapped to a multiple of 4.
+
+    Snapping keeps radius jitter from producing a new size (and a new
+    _SCALED_CACHE entry) for every pixel of difference.
+    """
+    th = max(8, int(enemy.radius * ENEMY_SPRITE_HEIGHT_PER_RADIUS))
+    return (th + 3) & ~3
+
+
+def _get_scaled_sprite(source_key, frame: pygame.Surface, target_h: int, facing_right: bool,
+                       frame_flipped: pygame.Surface | None = None) -> tuple[pygame.Surface, int, int]:
+    """Return frame scaled to target_h and flipped for facing, cached across frames.
+
+    Both orientations are stored together on a miss, so turning around
+    never has to flip a surface during drawing. When the caller already has
+    a mirrored source (see _store_sprite), it is scaled instead of flipping.
+
+    Returns:
+        (surface, anchor_x, anchor_y): the blit position for a sprite whose
+        feet stand at (x, y) is (x - anchor_x, y - anchor_y)
+    """
+    key = (source_key, target_h, facing_right)
+    entry = _SCALED_CACHE.get(key)
+    if entry is None:
+        scale = target_h / max(1, frame.get_height())
+        target_w = max(8, int(frame.get_width() * scale))
+        # Nearest-neighbour keeps the pixel-art edges crisp and is cheaper than smoothscale
+        right = pygame.transform.scale(frame, (target_w, target_h))
+        if frame_flipped is not None:
+            left = pygame.transform.scale(frame_flipped, (target_w, target_h))
+        else:
+            left = pygame.transform.flip(right, True, False)
+        # Bounded FIFO: drop the oldest pair when full
+        while len(_SCALED_CACHE) >= _SCALED_CACHE_MAX - 1:
+            del _SCALED_CACHE[next(iter(_SCALED_CACHE))]
+        # Foot-offset anchor, computed once per size instead of per draw
+        anchor_x = target_w // 2
+        anchor_y = target_h - int(target_h * ENEMY_SPRITE_FOOT_OFFSET_PCT)
+        _SCALED_CACHE[(source_key, target_h, True)] = (right, anchor_x, anchor_y)
+        _SCALED_CACHE[(source_key, target_h, False)] = (left, anchor_x, anchor_y)
+        entry = _SCALED_CACHE[key]
+    return entry
+
+
+def update_enemy_facing(enemy, prev_pos: tuple[float, float] | None, now_ms: int | None = None) -> None:
+    """Update facing with hysteresis to avoid jittery flipping.
+
+    now_ms is the frame's pygame tick count; callers drawing many enemies
+    should read it once and pass it in. Fetched here when omitted.
+    """
+    st = _enemy_state(enemy.id)
+    cur = (float(enemy.pos[0]), float(enemy.pos[1]))
     if prev_pos is None:
-        _ENEMY_FACING_RIGHT[eid] = _ENEMY_FACING_RIGHT.get(eid, True)
-        _ENEMY_SIGN_STREAK[eid] = 0
-        _ENEMY_LAST_FLIP_MS[eid] = _ENEMY_LAST_FLIP_MS.get(eid, 0)
-        _ENEMY_LAST_POS[eid] = (float(enemy.pos[0]), float(enemy.pos[1]))
+        st.sign_streak = 0
+        st.last_pos = cur
         return
 
-    dx = float(enemy.pos[0]) - float(prev_pos[0])
+    dx = cur[0] - float(prev_pos[0])
     # Ignore tiny horizontal jitters
     if abs(dx) < 1.0:
-        _ENEMY_SIGN_STREAK[eid] = 0
-        _ENEMY_LAST_POS[eid] = (float(enemy.pos[0]), float(enemy.pos[1]))
+        st.sign_streak = 0
+        st.last_pos = cur
         return
 
     want_right = dx > 0
-    curr_right = _ENEMY_FACING_RIGHT.get(eid, True)
     # If already facing desired direction, reset streak and exit
-    if want_right == curr_right:
-        _ENEMY_SIGN_STREAK[eid] = 0
-        _ENEMY_LAST_POS[eid] = (float(enemy.pos[0]), float(enemy.pos[1]))
+    if want_right == st.facing_right:
+        st.sign_streak = 0
+        st.last_pos = cur
         return
 
     # Hysteresis: require a few consecutive frames and a cooldown between flips
-    _ENEMY_SIGN_STREAK[eid] = _ENEMY_SIGN_STREAK.get(eid, 0) + 1
-    now = pygame.time.get_ticks()
-    last_flip = _ENEMY_LAST_FLIP_MS.get(eid, 0)
-    if _ENEMY_SIGN_STREAK[eid] >= 3 and (now - last_flip) >= 200:
-        _ENEMY_FACING_RIGHT[eid] = want_right
-        _ENEMY_SIGN_STREAK[eid] = 0
-        _ENEMY_LAST_FLIP_MS[eid] = now
-    _ENEMY_LAST_POS[eid] = (float(enemy.pos[0]), float(enemy.pos[1]))
-
-
-def draw_enemy_sprite(enemy, screen: pygame.Surface, screen_pos: tuple[int, int], relations) -> bool:
-    """Draw enemy sprite with faction-based coloring. Returns True if drawn."""
+    st.sign_streak += 1
+    now = pygame.time.get_ticks() if now_ms is None else now_ms
+    if st.sign_streak >= 3 and (now - st.last_flip_ms) >= 200:
+        st.facing_right = want_right
+        st.sign_streak = 0
+        st.last_flip_ms = now
+    st.last_pos = cur
+
+
+def _resolve_enemy_sprite(enemy, screen_pos: tuple[int, int], relations,
+                          now_ms: int | None) -> tuple[pygame.Surface, tuple[int, int]] | None:
+    """Pick the finished surface and blit position for an enemy, or None."""
     # Determine color and archetype
     color = get_faction_color(enemy, relations)
-    archetype = getattr(enemy, 'archetype', 'melee')
+    archetype = enemy.archetype
+    st = _enemy_state(enemy.id)
 
     # Special case: Animated Minotaur (Idle/Walk)
-    if str(archetype).lower() == 'minotaur':
-        def _get_frames(anim_name: str) -> list[pygame.Surface]:
-            key = f"minotaur2_{anim_name}"
-            if key in _FRAME_LIST_CACHE:
-                return _FRAME_LIST_CACHE[key]
-            path = os.path.join("Tiny Swords (Free Pack)", "Units", "Minotaur_2", f"{anim_name}.png")
-            try:
-                sheet = pygame.image.load(path).convert_alpha()
-                sw, sh = sheet.get_width(), sheet.get_height()
-                frames = load_spritesheet(path, sh, sh)
-                if len(frames) <= 1 and sw > 0:
-                    fw = max(1, sw // 8)
-                    frames = load_spritesheet(path, fw, sh, num_frames=8)
-            except Exception:
-                frames = []
-            _FRAME_LIST_CACHE[key] = frames
-            return frames
-
-        idle_frames = _get_frames('Idle')
-        walk_frames = _get_frames('Walk')
+    if archetype == 'minotaur':
+        idle_frames = _get_minotaur_frames('Idle')
+        walk_frames = _get_minotaur_frames('Walk')
         # simple movement detection using last pos
-        prev = _ENEMY_LAST_POS.get(enemy.id)
+        prev = st.last_pos
         cur = (float(enemy.pos[0]), float(enemy.pos[1]))
         moving = False
         if prev is not None:
             dx = cur[0] - prev[0]
             dy = cur[1] - prev[1]
             moving = (abs(dx) + abs(dy)) > 0.5
-        _ENEMY_LAST_POS[enemy.id] = cur
+        st.last_pos = cur
 
         frames = walk_frames if (moving and walk_frames) else idle_frames
         if frames:
             ms = 100 if moving else 140
-            idx = (pygame.time.get_ticks() // ms) % max(1, len(frames))
+            if now_ms is None:
+                now_ms = pygame.time.get_ticks()
+            idx = (now_ms // ms) % max(1, len(frames))
             frame = frames[int(idx)]
 
-            # Scale
-            target_h = max(8, int(getattr(enemy, 'radius', 10) * ENEMY_SPRITE_HEIGHT_PER_RADIUS))
-            scale = target_h / max(1, frame.get_height())
-            target_w = max(8, int(frame.get_width() * scale))
-            sprite_scaled = pygame.transform.smoothscale(frame, (target_w, target_h))
-
-            # Flip according to facing
-            facing_right = _ENEMY_FACING_RIGHT.get(enemy.id, True)
-            if not facing_right:
-                sprite_scaled = pygame.transform.flip(sprite_scaled, True, False)
+            # Scale and flip according to facing (cached)
+            target_h = _sprite_height(enemy)
+            facing_right = st.facing_right
+            anim_name = 'Walk' if frames is walk_frames else 'Idle'
+            sprite_scaled, anchor_x, anchor_y = _get_scaled_sprite((anim_name, int(idx)), frame, target_h, facing_right)
 
             # Draw with foot offset
             x, y = screen_pos
-            offset_y = int(target_h * ENEMY_SPRITE_FOOT_OFFSET_PCT)
-            blit_pos = (int(x - target_w // 2), int(y - target_h + offset_y))
-            screen.blit(sprite_scaled, blit_pos)
-            return True
+            return sprite_scaled, (int(x - anchor_x), int(y - anchor_y))
 
-    sprite = _load_enemy_sprite(color, archetype, enemy)
+    # The resolved sprite only depends on color, faction and troop type, so keep
+    # it on the enemy and reload only when one of those changes
+    sprite_key = (color, getattr(enemy, 'faction', None), getattr(enemy, 'troop_type', None))
+    if getattr(enemy, '_cached_sprite_key', None) == sprite_key:
+        sprite = enemy._cached_sprite
+    else:
+        sprite = _load_enemy_sprite(color, archetype, enemy)
+        enemy._cached_sprite = sprite
+        enemy._cached_sprite_flip = _CACHE.get(f"enemy_{color}_{archetype}_flip")
+        enemy._cached_sprite_key = sprite_key
     if not sprite:
-        return False
-
-    # Scale to enemy radius
-    target_h = max(8, int(getattr(enemy, 'radius', 10) * ENEMY_SPRITE_HEIGHT_PER_RADIUS))
-    scale = target_h / max(1, sprite.get_height())
-    target_w = max(8, int(sprite.get_width() * scale))
-    sprite_scaled = pygame.transform.smoothscale(sprite, (target_w, target_h))
+        return None
 
-    # Apply flip
-    facing_right = _ENEMY_FACING_RIGHT.get(enemy.id, True)
-    if not facing_right:
-        sprite_scaled = pygame.transform.flip(sprite_scaled, True, False)
+    # Scale to enemy radius and apply flip (cached)
+    target_h = _sprite_height(enemy)
+    facing_right = st.facing_right
+    sprite_scaled, anchor_x, anchor_y = _get_scaled_sprite(
+        id(sprite), sprite, target_h, facing_right, enemy._cached_sprite_flip)
 
     # Draw with foot offset
     x, y = screen_pos
-    offset_y = int(target_h * ENEMY_SPRITE_FOOT_OFFSET_PCT)
-    blit_pos = (int(x - target_w // 2), int(y - target_h + offset_y))
-    screen.blit(sprite_scaled, blit_pos)
+    return sprite_scaled, (int(x - anchor_x), int(y - anchor_y))
+
+
+def draw_enemy_sprite(enemy, screen: pygame.Surface, screen_pos: tuple[int, int], relations,
+                      now_ms: int | None = None) -> bool:
+    """Draw enemy sprite with faction-based coloring. Returns True if drawn.
+
+    now_ms is the frame's pygame tick count (see update_enemy_facing).
+    """
+    resolved = _resolve_enemy_sprite(enemy, screen_pos, relations, now_ms)
+    if resolved is None:
+        return False
+    screen.blit(*resolved)
     return True
 
+
+def draw_enemies_batch(enemies, screen_positions, screen: pygame.Surface, relations,
+                       now_ms: int | None = None) -> list[bool]:
+    """Draw many enemy sprites with a single Surface.blits call.
+
+    Args:
+        enemies: Enemies to draw, in back-to-front order
+        screen_positions: Screen position of each enemy (aligned with enemies)
+        screen: Target surface
+        relations: Player faction relations (for sprite color)
+        now_ms: Frame tick count; fetched once here when omitted
+
+    Returns:
+        Per-enemy flags, True where a sprite was drawn (False means the caller
+        should draw its fallback shape)
+    """
+    if now_ms is None:
+        now_ms = pygame.time.get_ticks()
+    blit_seq = []
+    drawn = []
+    for enemy, screen_pos in zip(enemies, screen_positions):
+        resolved = _resolve_enemy_sprite(enemy, screen_pos, relations, now_ms)
+        drawn.append(resolved is not None)
+        if resolved is not None:
+            blit_seq.append(resolved)
+    # Keep the given order: software blits have no texture-bind cost to sort
+    # for, and reordering would change which overlapping enemy is on top
+    screen.blits(blit_seq, doreturn=False)
+    return drawn
+
@@ -10,7 +10,7 @@ import random
 from typing import Tuple, TYPE_CHECKING
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     hp_max: float
     hp: float
@@ -53,6 +53,23 @@ class Stats:
 class Entity:
     """Minimal entity with circular collision and basic damage."""
 
+    # No __dict__: every attribute is a slot. The per-role extras that
+    # spawners, the overworld AI and battles attach are declared here too and
+    # stay unset until assigned, so getattr(e, name, default) and hasattr()
+    # checks behave as before. Add new per-entity attributes to this list.
+    __slots__ = (
+        'id', 'kind', 'pos', 'vel', 'radius', 'stats', '_invuln', 'equipment', 'inventory',
+        '_dmg_mult', '_dmg_mult_key',
+        'troop_type', 'unit_type', 'enemy_type', 'faction', 'archetype',
+        '_cached_sprite', '_cached_sprite_flip', '_cached_sprite_key', '_faction_color', '_enemy_type_lc', '_troop_type_lc',
+        # Battle side (battle.BattleController) and weapon requirement penalty (attributes)
+        'team', 'equipment_penalty',
+        # Overworld AI state (world.update_world)
+        'home_pos', 'ai_state', 'patrol_timer', 'patrol_target', 'chase_alert_cooldown', '_active',
+        # Overworld army markers and unique monsters (world spawners)
+        'is_army', 'army_size', 'avg_tier', 'is_monster', 'is_unique_monster',
+    )
+
     def __init__(self, ent_id: int, kind: str, pos: Tuple[float, float], radius: float, stats: Stats):
         self.id = ent_id
         self.kind = kind
@@ -62,7 +79,9 @@ class Entity:
         self.stats = stats
         self._invuln = 0.0
         self.equipment: equipment.Equipment | None = None
-        self.inventory: list[items.Item] = []
+        self.inventory: items.ItemList = items.ItemList()
+        self._dmg_mult = 1.0
+        self._dmg_mult_key: tuple | None = None
 
     def update(self, dt: float) -> None:
         if self._invuln > 0:
@@ -74,29 +93,7 @@ class Entity:
         dmg = float(amount)
 
         # DEFENSE SYSTEM: Armor and VIT defense combine MULTIPLICATIVELY
-        try:
-            armor_def = 0.0
-            vit_def = 0.0
-
-            # 1. Armor defense from equipment
-            if getattr(self, 'equipment', None):
-                armor_def = self.equipment.get_total_defense()
-                # Simple shield passive if weapon is a shield
-                weapon = self.equipment.get_weapon()
-                if getattr(weapon, 'weapon_type', '') == 'shield':
-                    armor_def = min(0.9, armor_def + 0.05)  # small bonus
-
-            # 2. VIT defense from attributes (player only)
-            if hasattr(self.stats, 'defense'):
-                vit_def = self.stats.defense
-
-            # 3. MULTIPLICATIVE COMBINATION (not additive!)
-            # Formula: final_damage = damage * (1 - armor) * (1 - vit)
-            # Example: 20% armor + 30% vit = 1 - (0.8 * 0.7) = 44% total (not 50%)
-            dmg = dmg * (1.0 - armor_def) * (1.0 - vit_def)
-
-        except Exception:
-            pass
+        dmg *= self._damage_multiplier()
 
         self.stats.hp = max(0.0, self.stats.hp - dmg)
         self._invuln = 0.3
@@ -104,6 +101,40 @@ class Entity:
     def alive(self) -> bool:
         return self.stats.hp > 0.0
 
+    def _damage_multiplier(self) -> float:
+        """Incoming damage multiplier, (1 - armor) * (1 - vit).
+
+        Cached in _dmg_mult and recomputed only when the packed equipment
+        state or the VIT defense change; unequipped entities (most enemies) skip the gear
+        lookups entirely.
+        """
+        eq = self.equipment
+        vit_def = self.stats.defense
+        if eq is None:
+            return 1.0 - vit_def
+        key = (eq.packed_state(), vit_def)
+        if key != self._dmg_mult_key:
+            self._dmg_mult_key = key
+            self._dmg_mult = self._recompute_dmg_mult(eq, vit_def)
+        return self._dmg_mult
+
+    @staticmethod
+    def _recompute_dmg_mult(eq: equipment.Equipment, vit_def: float) -> float:
+        try:
+            # 1. Armor defense from equipment
+            armor_def = eq.get_total_defense()
+            # Simple shield passive if weapon is a shield
+            weapon = eq.get_weapon()
+            if getattr(weapon, 'weapon_type', '') == 'shield':
+                armor_def = min(0.9, armor_def + 0.05)  # small bonus
+
+            # 2. MULTIPLICATIVE COMBINATION with VIT defense (not additive!)
+            # Formula: final_damage = damage * (1 - armor) * (1 - vit)
+            # Example: 20% armor + 30% vit = 1 - (0.8 * 0.7) = 44% total (not 50%)
+            return (1.0 - armor_def) * (1.0 - vit_def)
+        except Exception:
+            return 1.0
+
 
 def create_player(seed: int) -> Entity:
     """Create a new player with default stats.
@@ -176,6 +207,43 @@ def create_troop(seed: int, troop_type: str, tier: int) -> Entity:
     return troop
 
 
+# Enemy base stats by type: (hp, hp/tier, atk, atk/tier, spd, spd/tier)
+_ENEMY_STATS: dict[str, tuple[int, int, int, int, int, int]] = {
+    "bandit": (25, 10, 7, 3, 160, 12),           # Fast
+    "soldier": (35, 12, 6, 3, 130, 8),           # Balanced
+    "brute": (50, 15, 10, 4, 100, 5),            # Slow but hits hard
+    "beast": (20, 8, 8, 2, 180, 15),             # Very fast
+    # 280 BC themed archetypes
+    "phalangite": (55, 15, 9, 4, 95, 4),         # Heavy formation infantry
+    "hoplite": (45, 12, 8, 3, 110, 6),           # Shielded, disciplined
+    "legionary": (50, 14, 9, 4, 115, 6),         # Well-balanced professional
+    "cataphract": (70, 20, 11, 4, 105, 5),       # Heavy cavalry prototype
+    "ptolemaic_guard": (50, 14, 8, 3, 110, 6),
+    "carthaginian": (45, 12, 8, 3, 120, 7),
+    "pontic_raider": (35, 10, 8, 3, 140, 10),
+    "thracian": (40, 12, 10, 4, 130, 9),         # Aggressive
+    "kush_archer": (30, 10, 9, 3, 145, 10),      # Mobile archer
+    "maurya_spearman": (45, 12, 9, 3, 120, 7),
+    # New archer types
+    "macedon_archer": (32, 10, 8, 3, 140, 9),    # Macedonian archer
+    "greek_archer": (30, 10, 8, 3, 135, 8),      # Greek archer
+    "egyptian_archer": (30, 10, 9, 3, 140, 9),   # Egyptian archer
+    "seleucid_archer": (32, 10, 9, 3, 145, 10),  # Seleucid composite bow archer
+    "roman_archer": (35, 11, 8, 3, 130, 8),      # Roman auxiliary archer
+    "carthage_archer": (32, 10, 9, 3, 140, 9),   # Carthaginian archer
+}
+# Unknown types get generic stats (and are stored as "bandit")
+_ENEMY_STATS_DEFAULT = (30, 12, 6, 3, 140, 10)
+
+# AI troop_type per enemy type: archers kite, heavy units act as tanks
+_TROOP_TYPE_MAP: dict[str, str] = {
+    et: ('archer' if ('archer' in et or 'bow' in et)
+         else 'tank' if et in ('cataphract', 'phalangite', 'ptolemaic_guard')
+         else 'warrior')
+    for et in _ENEMY_STATS
+}
+
+
 def create_enemy(seed: int, tier: int, enemy_type: str = None) -> Entity:
     """Create an enemy with varied types and stats.
 
@@ -197,94 +265,16 @@ def create_enemy(seed: int, tier: int, enemy_type: str = None) -> Entity:
             "thracian", "kush_archer", "maurya_spearman"
         ])
 
-    # Base stats vary by type
-    if enemy_type == "bandit":
-        base_hp = 25 + 10 * tier
-        base_atk = 7 + 3 * tier
-        base_spd = 160 + 12 * tier  # Fast
-    elif enemy_type == "soldier":
-        base_hp = 35 + 12 * tier
-        base_atk = 6 + 3 * tier
-        base_spd = 130 + 8 * tier   # Balanced
-    elif enemy_type == "brute":
-        base_hp = 50 + 15 * tier
-        base_atk = 10 + 4 * tier
-        base_spd = 100 + 5 * tier   # Slow but hits hard
-    elif enemy_type == "beast":
-        base_hp = 20 + 8 * tier
-        base_atk = 8 + 2 * tier
-        base_spd = 180 + 15 * tier  # Very fast
-    elif enemy_type == "phalangite":
-        base_hp = 55 + 15 * tier
-        base_atk = 9 + 4 * tier
-        base_spd = 95 + 4 * tier   # Heavy formation infantry
-    elif enemy_type == "hoplite":
-        base_hp = 45 + 12 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 110 + 6 * tier  # Shielded, disciplined
-    elif enemy_type == "legionary":
-        base_hp = 50 + 14 * tier
-        base_atk = 9 + 4 * tier
-        base_spd = 115 + 6 * tier  # Well-balanced professional
-    elif enemy_type == "cataphract":
-        base_hp = 70 + 20 * tier
-        base_atk = 11 + 4 * tier
-        base_spd = 105 + 5 * tier  # Heavy cavalry prototype
-    elif enemy_type == "ptolemaic_guard":
-        base_hp = 50 + 14 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 110 + 6 * tier
-    elif enemy_type == "carthaginian":
-        base_hp = 45 + 12 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 120 + 7 * tier
-    elif enemy_type == "pontic_raider":
-        base_hp = 35 + 10 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 140 + 10 * tier
-    elif enemy_type == "thracian":
-        base_hp = 40 + 12 * tier
-        base_atk = 10 + 4 * tier
-        base_spd = 130 + 9 * tier   # Aggressive
-    elif enemy_type == "kush_archer":
-        base_hp = 30 + 10 * tier
-        base_atk = 9 + 3 * tier
-        base_spd = 145 + 10 * tier  # Mobile archer
-    elif enemy_type == "maurya_spearman":
-        base_hp = 45 + 12 * tier
-        base_atk = 9 + 3 * tier
-        base_spd = 120 + 7 * tier
-    # New archer types
-    elif enemy_type == "macedon_archer":
-        base_hp = 32 + 10 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 140 + 9 * tier  # Macedonian archer
-    elif enemy_type == "greek_archer":
-        base_hp = 30 + 10 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 135 + 8 * tier  # Greek archer
-    elif enemy_type == "egyptian_archer":
-        base_hp = 30 + 10 * tier
-        base_atk = 9 + 3 * tier
-        base_spd = 140 + 9 * tier  # Egyptian archer
-    elif enemy_type == "seleucid_archer":
-        base_hp = 32 + 10 * tier
-        base_atk = 9 + 3 * tier
-        base_spd = 145 + 10 * tier  # Seleucid composite bow archer
-    elif enemy_type == "roman_archer":
-        base_hp = 35 + 11 * tier
-        base_atk = 8 + 3 * tier
-        base_spd = 130 + 8 * tier  # Roman auxiliary archer
-    elif enemy_type == "carthage_archer":
-        base_hp = 32 + 10 * tier
-        base_atk = 9 + 3 * tier
-        base_spd = 140 + 9 * tier  # Carthaginian archer
-    else:
+    # Base stats vary by type: value = base + per_tier * tier
+    stats_row = _ENEMY_STATS.get(enemy_type)
+    if stats_row is None:
         # Fallback to generic
-        base_hp = 30 + 12 * tier
-        base_atk = 6 + 3 * tier
-        base_spd = 140 + 10 * tier
+        stats_row = _ENEMY_STATS_DEFAULT
         enemy_type = "bandit"
+    hp0, hp1, atk0, atk1, spd0, spd1 = stats_row
+    base_hp = hp0 + hp1 * tier
+    base_atk = atk0 + atk1 * tier
+    base_spd = spd0 + spd1 * tier
 
     s = Stats(hp_max=base_hp, hp=base_hp, atk=base_atk, spd=base_spd, level=max(1, tier), xp=0, xp_to_next_level=max(1, tier) * 10)
     ex = 200 + rng.randint(0, 800)
@@ -292,15 +282,14 @@ def create_enemy(seed: int, tier: int, enemy_type: str = None) -> Entity:
 
     enemy = Entity(rng.randint(2, 1_000_000), f"enemy_{enemy_type}", (ex, ey), 14.0, s)
     enemy.enemy_type = enemy_type  # Store for AI behavior
+    enemy.archetype = 'melee'  # Sprite archetype; spawners override (e.g. 'minotaur')
 
     # Determine troop_type based on enemy_type for proper AI behavior
-    enemy_type_lower = enemy_type.lower()
-    if 'archer' in enemy_type_lower or 'bow' in enemy_type_lower:
-        enemy.troop_type = 'archer'
-    elif enemy_type in ('cataphract', 'phalangite', 'ptolemaic_guard'):
-        enemy.troop_type = 'tank'
-    else:
-        enemy.troop_type = 'warrior'
+    enemy.troop_type = _TROOP_TYPE_MAP[enemy_type]
+
+    # Lowercased names for sprite lookups, so drawing code need not re-lowercase
+    enemy._enemy_type_lc = enemy_type  # table keys are already lowercase
+    enemy._troop_type_lc = enemy.troop_type
 
     return enemy
 
@@ -311,6 +300,16 @@ def distance(a: Entity, b: Entity) -> float:
     return math.hypot(dx, dy)
 
 
+def dist_sq(a: Entity, b: Entity) -> float:
+    """Squared distance between two entities.
+
+    Use for range checks (compare against radius * radius) to skip the sqrt.
+    """
+    dx = a.pos[0] - b.pos[0]
+    dy = a.pos[1] - b.pos[1]
+    return dx * dx + dy * dy
+
+
 @dataclass
 class Location:
     """Represents a location on the world map."""
@@ -326,11 +325,19 @@ class Location:
         dy = self.pos[1] - entity.pos[1]
         return math.hypot(dx, dy)
 
+    def distance_sq_to(self, entity: Entity) -> float:
+        """Squared distance from location center to an entity (for range checks)."""
+        dx = self.pos[0] - entity.pos[0]
+        dy = self.pos[1] - entity.pos[1]
+        return dx * dx + dy * dy
+
 
 @dataclass
 class FactionRelations:
     """Manages player's relations with factions."""
     relations: dict[str, int] = None
+    # Bumped on every change so readers can cache values derived from relations
+    version: int = 0
 
     def __post_init__(self):
         if self.relations is None:
@@ -353,6 +360,7 @@ class FactionRelations:
     def update_relation(self, faction: str, amount: int):
         if faction in self.relations:
             self.relations[faction] = max(-100, min(100, self.relations[faction] + amount))
+            self.version += 1
 
     def get_status(self, faction: str) -> str:
         relation = self.relations.get(faction, 0)
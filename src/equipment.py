@@ -1,16 +1,28 @@
 """Equipment system: weapons, armor, items."""
 
 from __future__ import annotations
+import functools
+import operator
 import random
-from dataclasses import dataclass
+import re
+import sys
+import types
+from dataclasses import dataclass, field
 from typing import Optional
+
 from . import items
 from . import factions
+from .constants_enums import ArmorMat, DamageType, ARMOR_MAT_BY_NAME, DAMAGE_TYPE_BY_NAME
+
 
+# Display prefixes per tier
+_WEAPON_TIER_NAMES = types.MappingProxyType({1: "Basic", 2: "Advanced", 3: "Master"})
+_ARMOR_TIER_NAMES = types.MappingProxyType({1: "Leather", 2: "Chainmail", 3: "Plate"})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Weapon:
-    """Weapon with stats and properties."""
+    """Weapon with stats and properties (immutable database entry)."""
     name: str
     weapon_type: str  # "sword", "axe", "spear", "bow", "shield"
     tier: int  # 1=Basic, 2=Advanced, 3=Master
@@ -21,15 +33,22 @@ class Weapon:
     stamina_cost: float  # Stamina cost per attack
     value: int  # Gold cost
     damage_type: str = "slashing"  # "slashing", "piercing", "bludgeoning"
+    dmg_type: DamageType = field(init=False, repr=False)  # integer code of damage_type
+    _display_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "damage_type", sys.intern(self.damage_type))
+        object.__setattr__(self, "dmg_type", DAMAGE_TYPE_BY_NAME.get(self.damage_type, DamageType.SLASHING))
+        object.__setattr__(self, "_display_name", f"{_WEAPON_TIER_NAMES.get(self.tier, '')} {self.name}")
 
     def get_display_name(self) -> str:
         """Get display name with tier."""
-        tier_names = {1: "Basic", 2: "Advanced", 3: "Master"}
-        return f"{tier_names.get(self.tier, '')} {self.name}"
+        return self._display_name
 
 
 # WEAPON DATABASE (Balanced costs - T3 reduced ~40%)
-WEAPONS = {
+_WEAPON_TABLE = {
     # SWORDS - Balanced (SLASHING)
     "sword_1": Weapon("Sword", "sword", 1, 1.0, 30, 0.8, 1.0, 15, 50, "slashing"),
     "sword_2": Weapon("Longsword", "sword", 2, 1.4, 35, 0.75, 0.95, 18, 200, "slashing"),
@@ -98,20 +117,38 @@ WEAPONS = {
     "sabertooth_claws": Weapon("Sabertooth Claws", "sword", 3, 1.8, 34, 0.65, 1.06, 12, 600, "slashing"),
 }
 
+# Read-only public view; module code reads the backing dict and tuple directly
+WEAPONS = types.MappingProxyType(_WEAPON_TABLE)
+_WEAPONS_TUPLE = tuple(_WEAPON_TABLE.values())
+
+# Inverted indexes over WEAPONS, built once at import (insertion order kept)
+_WEAPONS_BY_TYPE: dict[str, list[Weapon]] = {}
+_WEAPONS_BY_TIER: dict[int, list[Weapon]] = {}
+for _w in _WEAPONS_TUPLE:
+    _WEAPONS_BY_TYPE.setdefault(_w.weapon_type, []).append(_w)
+    _WEAPONS_BY_TIER.setdefault(_w.tier, []).append(_w)
+del _w
+
 
 def get_weapon(weapon_id: str) -> Optional[Weapon]:
     """Get weapon by ID."""
-    return WEAPONS.get(weapon_id)
+    return _WEAPON_TABLE.get(weapon_id)
 
 
 def get_weapons_by_type(weapon_type: str) -> list[Weapon]:
-    """Get all weapons of a type."""
-    return [w for w in WEAPONS.values() if w.weapon_type == weapon_type]
+    """Get all weapons of a type.
+
+    The returned list is shared with the module index; do not mutate it.
+    """
+    return _WEAPONS_BY_TYPE.get(weapon_type, [])
 
 
 def get_weapons_by_tier(tier: int) -> list[Weapon]:
-    """Get all weapons of a tier."""
-    return [w for w in WEAPONS.values() if w.tier == tier]
+    """Get all weapons of a tier.
+
+    The returned list is shared with the module index; do not mutate it.
+    """
+    return _WEAPONS_BY_TIER.get(tier, [])
 
 
 def get_starter_weapon() -> Weapon:
@@ -119,9 +156,9 @@ def get_starter_weapon() -> Weapon:
     return WEAPONS["sword_1"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Armor:
-    """Armor piece."""
+    """Armor piece (immutable database entry)."""
     name: str
     armor_type: str  # "helmet", "chest", "legs", "boots"
     tier: int
@@ -129,14 +166,20 @@ class Armor:
     speed_penalty: float  # Speed reduction
     value: int
     material: str = "leather"  # "leather", "bronze", "chainmail", "plate"
+    mat: ArmorMat = field(init=False, repr=False)  # integer code of material
+    _display_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "material", sys.intern(self.material))
+        object.__setattr__(self, "mat", ARMOR_MAT_BY_NAME.get(self.material, ArmorMat.LEATHER))
+        object.__setattr__(self, "_display_name", f"{_ARMOR_TIER_NAMES.get(self.tier, '')} {self.name}")
 
     def get_display_name(self) -> str:
-        tier_names = {1: "Leather", 2: "Chainmail", 3: "Plate"}
-        return f"{tier_names.get(self.tier, '')} {self.name}"
+        return self._display_name
 
 
 # ARMOR DATABASE (Balanced costs - T3 reduced ~40%)
-ARMORS = {
+_ARMOR_TABLE = {
     # HELMETS
     "helm_1": Armor("Helmet", "helmet", 1, 0.05, 0.0, 30, "leather"),
     "helm_2": Armor("Helmet", "helmet", 2, 0.10, 0.02, 120, "chainmail"),
@@ -177,10 +220,14 @@ ARMORS = {
     "nemean_lion_hide": Armor("Nemean Lion Hide", "chest", 3, 0.24, 0.02, 850, "leather"),
 }
 
+# Read-only public view; module code reads the backing dict and tuple directly
+ARMORS = types.MappingProxyType(_ARMOR_TABLE)
+_ARMORS_TUPLE = tuple(_ARMOR_TABLE.values())
+
 
 def get_armor(armor_id: str) -> Optional[Armor]:
     """Get armor by ID."""
-    return ARMORS.get(armor_id)
+    return _ARMOR_TABLE.get(armor_id)
 
 
 def get_starter_armor() -> dict[str, str]:
@@ -193,76 +240,141 @@ def get_starter_armor() -> dict[str, str]:
     }
 
 
-@dataclass
+# Flat armor rows: _ARMOR_ROW[armor_id] indexes the column tuples below. The
+# extra last row is all zeros and stands in for empty or unknown slots.
+_ARMOR_ROW = {armor_id: i for i, armor_id in enumerate(ARMORS)}
+_NO_ARMOR_ROW = len(ARMORS)
+_A_DEF = tuple(a.defense for a in _ARMORS_TUPLE) + (0.0,)
+_A_SPD = tuple(a.speed_penalty for a in _ARMORS_TUPLE) + (0.0,)
+_A_VAL = tuple(a.value for a in _ARMORS_TUPLE) + (0,)
+
+# Weapon codes for Equipment.packed_state (unknown ids share the last code)
+_WEAPON_CODE = {weapon_id: i for i, weapon_id in enumerate(WEAPONS)}
+_NO_WEAPON_CODE = len(WEAPONS)
+
+# packed_state field widths, sized from the tables so a code can never spill
+# into the neighbouring slot however many weapons or armors are added
+_WEAPON_BITS = _NO_WEAPON_CODE.bit_length()
+_ARMOR_BITS = _NO_ARMOR_ROW.bit_length()
+_HELMET_SHIFT = _WEAPON_BITS
+_CHEST_SHIFT = _HELMET_SHIFT + _ARMOR_BITS
+_LEGS_SHIFT = _CHEST_SHIFT + _ARMOR_BITS
+_BOOTS_SHIFT = _LEGS_SHIFT + _ARMOR_BITS
+
+# Armor slot names, and a getter returning their ids as one tuple
+_ARMOR_SLOTS = ("helmet", "chest", "legs", "boots")
+_get_slots = operator.attrgetter(*_ARMOR_SLOTS)
+
+# Slots in the order their material dominates (chest is most important)
+_get_material_priority_slots = operator.attrgetter("chest", "helmet", "legs", "boots")
+
+# Equipment fields whose assignment invalidates the cached aggregates
+_EQUIPMENT_SLOTS = frozenset(("weapon",) + _ARMOR_SLOTS)
+
+
+@dataclass(slots=True)
 class Equipment:
-    """Player equipment loadout."""
+    """Player equipment loadout.
+
+    Armor aggregates (defense, speed penalty, value, primary armor) are
+    computed once and cached until one of the slots is reassigned.
+    """
     weapon: str = "sword_1"  # Weapon ID
     helmet: str = "helm_1"
     chest: str = "chest_1"
     legs: str = "legs_1"
     boots: str = "boots_1"
+    _def: float = field(default=0.0, init=False, repr=False, compare=False)
+    _spd: float = field(default=0.0, init=False, repr=False, compare=False)
+    _val: int = field(default=0, init=False, repr=False, compare=False)
+    _mat: Optional[Armor] = field(default=None, init=False, repr=False, compare=False)
+    _packed: int = field(default=0, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name in _EQUIPMENT_SLOTS:
+            # Ids may come from save data; intern so table lookups hit the
+            # identity shortcut against the (interned) database keys
+            if type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, "_dirty", True)
+        object.__setattr__(self, name, value)
+
+    def _refresh(self) -> None:
+        """Recompute the cached armor aggregates after a slot change."""
+        row = _ARMOR_ROW.get
+        h, c, l, b = [row(armor_id, _NO_ARMOR_ROW) for armor_id in _get_slots(self)]
+        self._def = min(0.75, _A_DEF[h] + _A_DEF[c] + _A_DEF[l] + _A_DEF[b])  # Cap at 75%
+        self._spd = _A_SPD[h] + _A_SPD[c] + _A_SPD[l] + _A_SPD[b]
+        self._val = self.get_weapon().value + _A_VAL[h] + _A_VAL[c] + _A_VAL[l] + _A_VAL[b]
+        self._mat = self._find_primary_armor()
+        self._packed = (_WEAPON_CODE.get(self.weapon, _NO_WEAPON_CODE)
+                        | h << _HELMET_SHIFT | c << _CHEST_SHIFT
+                        | l << _LEGS_SHIFT | b << _BOOTS_SHIFT)
+        self._dirty = False
 
     def get_weapon(self) -> Weapon:
         """Get equipped weapon."""
         return get_weapon(self.weapon) or get_starter_weapon()
 
+    def packed_state(self) -> int:
+        """Get the whole loadout packed into one int (one bit field per slot).
+
+        Two loadouts with equal packed states have identical stats, so
+        callers can dirty-check gear with a single int compare.
+        """
+        if self._dirty:
+            self._refresh()
+        return self._packed
+
     def get_total_defense(self) -> float:
         """Calculate total defense from armor."""
-        total = 0.0
-        for armor_id in [self.helmet, self.chest, self.legs, self.boots]:
-            armor = get_armor(armor_id)
-            if armor:
-                total += armor.defense
-        return min(0.75, total)  # Cap at 75%
+        if self._dirty:
+            self._refresh()
+        return self._def
 
     def get_speed_penalty(self) -> float:
         """Calculate total speed penalty from armor."""
-        total = 0.0
-        for armor_id in [self.helmet, self.chest, self.legs, self.boots]:
-            armor = get_armor(armor_id)
-            if armor:
-                total += armor.speed_penalty
-        return total
+        if self._dirty:
+            self._refresh()
+        return self._spd
 
     def get_total_value(self) -> int:
         """Get total gold value of equipment."""
-        total = 0
-        weapon = self.get_weapon()
-        if weapon:
-            total += weapon.value
-        for armor_id in [self.helmet, self.chest, self.legs, self.boots]:
-            armor = get_armor(armor_id)
-            if armor:
-                total += armor.value
-        return total
+        if self._dirty:
+            self._refresh()
+        return self._val
 
-    def get_primary_material(self) -> str:
-        """Get the dominant armor material (for damage type effectiveness).
+    def _get_primary_armor(self) -> Optional[Armor]:
+        """Get the armor piece whose material dominates (cached)."""
+        if self._dirty:
+            self._refresh()
+        return self._mat
+
+    def _find_primary_armor(self) -> Optional[Armor]:
+        """Find the armor piece whose material dominates.
 
         Priority: chest > helmet > legs > boots (chest is most important).
-        Returns: "leather", "bronze", "chainmail", or "plate"
         """
-        # Check chest first (most important piece)
-        chest_armor = get_armor(self.chest)
-        if chest_armor and chest_armor.material:
-            return chest_armor.material
-
-        # Fallback to helmet
-        helmet_armor = get_armor(self.helmet)
-        if helmet_armor and helmet_armor.material:
-            return helmet_armor.material
+        armors = _ARMOR_TABLE
+        for armor_id in _get_material_priority_slots(self):
+            armor = armors.get(armor_id)
+            if armor and armor.material:
+                return armor
+        return None
 
-        # Fallback to legs
-        legs_armor = get_armor(self.legs)
-        if legs_armor and legs_armor.material:
-            return legs_armor.material
+    def get_primary_material(self) -> str:
+        """Get the dominant armor material (for damage type effectiveness).
 
-        # Final fallback to boots or default
-        boots_armor = get_armor(self.boots)
-        if boots_armor and boots_armor.material:
-            return boots_armor.material
+        Returns: "leather", "bronze", "chainmail", or "plate"
+        """
+        armor = self._get_primary_armor()
+        return armor.material if armor else "leather"  # Default
 
-        return "leather"  # Default
+    def get_primary_armor_mat(self) -> ArmorMat:
+        """Get the dominant armor material as an ArmorMat code."""
+        armor = self._get_primary_armor()
+        return armor.mat if armor else ArmorMat.LEATHER
 
 
 def get_item(item_id: str) -> Optional[items.Item]:
@@ -272,21 +384,142 @@ def get_item(item_id: str) -> Optional[items.Item]:
 
 def get_all_items() -> dict[str, items.Item]:
     """Get a dictionary of all items in the game."""
-    return {**WEAPONS, **ARMORS}
+    return {**_WEAPON_TABLE, **_ARMOR_TABLE}
+
+
+# === Keyword matching ===
+class _KeywordRules:
+    """Ordered keyword rules matched with one regex pass over the name.
+
+    Each rule is (keywords, target): it fires when every keyword occurs in
+    the lowercased name, and the first firing rule wins. A target may be a
+    dict keyed by tier; tiers missing from it skip the rule.
+    """
+    __slots__ = ("pattern", "implied", "rules")
+
+    def __init__(self, rules):
+        self.rules = tuple((frozenset(kws), target) for kws, target in rules)
+        keywords = sorted({k for kws, _ in self.rules for k in kws}, key=len, reverse=True)
+        # Zero-width lookahead finds the longest keyword starting at every
+        # position; shorter keywords hidden inside it come from `implied`.
+        self.pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        self.implied = {k: frozenset(o for o in keywords if o in k) for k in keywords}
+
+    def match(self, name: str, tier: int = 1):
+        """Return the target of the first rule whose keywords all occur in name."""
+        found = set()
+        implied = self.implied
+        for kw in self.pattern.findall(name):
+            found |= implied[kw]
+        if not found:
+            return None
+        for kws, target in self.rules:
+            if kws <= found:
+                if type(target) is dict:
+                    target = target.get(tier)
+                    if target is None:
+                        continue
+                return target
+        return None
+
+
+_ARMOR_SLOT_RULES = _KeywordRules([
+    (("helm",), "helmet"),
+    (("cuirass",), "chest"), (("armor",), "chest"), (("linothorax",), "chest"), (("lorica",), "chest"),
+    (("scale",), "chest"), (("lamellar",), "chest"), (("chest",), "chest"),
+    (("leg",), "legs"), (("greave",), "legs"),
+    (("boot",), "boots"), (("sandal",), "boots"),
+])
+
+# Item name -> weapon ID, in priority order
+_WEAPON_ID_RULES = _KeywordRules([
+    # Bandit/simple weapons mapping
+    (("round", "shield"), "shield_1"),
+    (("club",), "axe_1"),  # club approximated by axe profile
+    (("hand axe",), "axe_1"),
+    (("dagger",), "sword_1"),
+    (("short spear",), "spear_1"),
+    (("self bow",), "bow_1"),
+    (("bow",), {1: "bow_1"}),
+    (("sling",), "bow_1"),  # sling approximated by primitive ranged
+    (("sarissa",), {1: "sarissa_1", 2: "sarissa_2", 3: "sarissa_3"}),
+    (("dory",), {1: "dory_1", 2: "dory_2", 3: "dory_2"}),
+    (("xiphos",), "xiphos_1"),
+    (("kopis",), "kopis_2"),
+    (("aspis",), "aspis_2"),
+    (("khopesh",), "khopesh_2"),
+    (("akinakes",), "akinakes_1"),
+    (("sabre",), "sabre_3"),
+    (("bow",), {1: "composite_bow_2", 2: "composite_bow_2", 3: "indian_composite_3"}),
+    (("gladius",), "gladius_2"),
+    (("pilum",), "pilum_2"),
+    (("scutum",), "scutum_2"),
+    (("carthaginian long spear",), "carth_spear_2"),
+    (("oval shield", "carthaginian"), "carth_oval_1"),
+    (("nubian longbow",), "kush_longbow_2"),
+    (("kushite short spear",), "kush_spear_1"),
+    (("mauryan long spear",), "maurya_spear_2"),
+    (("indian composite",), "indian_composite_3"),
+    (("pontic kopis",), "pontic_kopis_2"),
+    (("pontic light lance",), "pontic_lance_1"),
+    (("rhomphaia",), "rhomphaia_3"),
+    (("axe",), "light_axe_1"),
+    # Legendary monster weapons
+    (("cyclops", "club"), "cyclops_club"),
+    (("minotaur", "labrys"), "minotaur_labrys"),
+    (("boar", "tusk"), "boar_tusk_spear"),
+    (("sabertooth", "claw"), "sabertooth_claws"),
+    (("centaur", "lance"), "centaur_lance"),
+])
+
+# Item name -> (slot, armor ID), in priority order
+_ARMOR_ID_RULES = _KeywordRules([
+    # Legendary monster armors
+    (("dire wolf", "pelt"), ("chest", "dire_wolf_pelt")),
+    (("hydra", "scale"), ("chest", "hydra_scale_mail")),
+    (("nemean", "lion"), ("chest", "nemean_lion_hide")),
+    (("harpy", "feather"), ("chest", "harpy_feather_cloak")),
+    (("gorgon", "visor"), ("helmet", "gorgon_visor")),
+    # Helmets
+    (("corinth",), ("helmet", "corinthian_helm_2")),
+    (("phryg",), ("helmet", "phrygian_helm_1")),
+    (("illyr",), ("helmet", "illyrian_helm_1")),
+    (("montefortino",), ("helmet", "montefortino_helm_2")),
+    (("helm",), ("helmet", "balkan_simple_helm_1")),
+    (("crest",), ("helmet", "balkan_simple_helm_1")),
+    # Chest pieces
+    (("lorica",), ("chest", "lorica_hamata_3")),
+    (("hamata",), ("chest", "lorica_hamata_3")),
+    (("linothorax",), ("chest", "linothorax_2")),
+    (("cuirass",), ("chest", "muscled_cuirass_2")),
+    (("muscled", "lamellar"), ("chest", "muscled_cuirass_2")),
+    (("muscled", "armor"), ("chest", "muscled_cuirass_2")),
+    (("lamellar",), ("chest", "lamellar_armor_3")),
+    (("scale", "armor"), ("chest", "scale_armor_2")),
+    (("armor",), ("chest", "chest_2")),
+])
+
+
+# Generic fallbacks when no keyword rule matches, indexed by tier
+_FALLBACK_WEAPON_BY_TIER = {1: "sword_1", 2: "sword_2", 3: "sword_3"}
+_FALLBACK_CHEST_BY_TIER = {1: ("chest", "chest_1"), 2: ("chest", "chest_2"), 3: ("chest", "chest_3")}
+
+
+def _infer_weapon_id_from_item(it: items.Item) -> str:
+    name = getattr(it, "name", "").lower()
+    tier = max(1, min(3, getattr(it, "tier", 1)))
+    return _WEAPON_ID_RULES.match(name, tier) or _FALLBACK_WEAPON_BY_TIER[tier]
+
+
+def _infer_armor_slot_and_id_from_item(it: items.Item) -> tuple[str, str]:
+    name = getattr(it, "name", "").lower()
+    tier = max(1, min(3, getattr(it, "tier", 1)))
+    return _ARMOR_ID_RULES.match(name, tier) or _FALLBACK_CHEST_BY_TIER[tier]
 
 
 # === Comparison helpers ===
 def _infer_armor_slot_from_name(name: str) -> Optional[str]:
-    n = (name or "").lower()
-    if any(k in n for k in ("helm", "helmet")):
-        return "helmet"
-    if any(k in n for k in ("cuirass", "armor", "linothorax", "lorica", "scale", "lamellar", "chest")):
-        return "chest"
-    if any(k in n for k in ("leg", "greave")):
-        return "legs"
-    if any(k in n for k in ("boot", "sandal")):
-        return "boots"
-    return None
+    return _ARMOR_SLOT_RULES.match((name or "").lower())
 
 
 def get_equipped_item_for_comparison(player, candidate_item: items.Item) -> tuple[str, dict]:
@@ -297,49 +530,141 @@ def get_equipped_item_for_comparison(player, candidate_item: items.Item) -> tupl
     equipped_name = "None"
     stats = {"damage": None, "defense": None, "speed_modifier": None}
     eq = getattr(player, 'equipment', None)
-    if not eq:
-        return equipped_name, stats
-
-    try:
-        if candidate_item.item_type.name == 'WEAPON' or candidate_item.damage is not None:
-            w = eq.get_weapon()
-            if w:
-                equipped_name = w.get_display_name() if hasattr(w, 'get_display_name') else getattr(w, 'name', 'Weapon')
-                stats["damage"] = float(getattr(w, 'damage', 1.0))
-                # Map weapon speed_mult (e.g., 0.9..1.1) to an item-like speed_modifier (delta from 1.0)
-                stats["speed_modifier"] = float(getattr(w, 'speed_mult', 1.0)) - 1.0
-            return equipped_name, stats
-
-        # Armor path: infer slot from name
-        slot = _infer_armor_slot_from_name(getattr(candidate_item, 'name', ''))
-        armor_id = None
-        if slot == 'helmet':
-            armor_id = eq.helmet
-        elif slot == 'chest':
-            armor_id = eq.chest
-        elif slot == 'legs':
-            armor_id = eq.legs
-        elif slot == 'boots':
-            armor_id = eq.boots
-
-        if armor_id:
-            ar = get_armor(armor_id)
-            if ar:
-                equipped_name = ar.get_display_name() if hasattr(ar, 'get_display_name') else getattr(ar, 'name', 'Armor')
-                stats["defense"] = float(getattr(ar, 'defense', 0.0))
-                # Items store speed_modifier negative for penalty; map speed_penalty to -value
-                stats["speed_modifier"] = -float(getattr(ar, 'speed_penalty', 0.0))
-        return equipped_name, stats
-    except Exception:
+    if not isinstance(eq, Equipment) or candidate_item is None:
         return equipped_name, stats
 
-
+    if (getattr(candidate_item, 'item_type', None) is items.ItemType.WEAPON
+            or getattr(candidate_item, 'damage', None) is not None):
+        w = eq.get_weapon()  # always a Weapon (falls back to the starter)
+        # Map weapon speed_mult (e.g., 0.9..1.1) to an item-like speed_modifier (delta from 1.0)
+        stats["damage"], stats["speed_modifier"] = float(w.damage), float(w.speed_mult) - 1.0
+        return w.get_display_name(), stats
+
+    # Armor path: infer slot from name
+    # Slot names match the Equipment attribute names
+    slot = _infer_armor_slot_from_name(getattr(candidate_item, 'name', ''))
+    armor_id = getattr(eq, slot, None) if slot else None
+    ar = _ARMOR_TABLE.get(armor_id) if armor_id else None
+    if ar:
+        # Items store speed_modifier negative for penalty; map speed_penalty to -value
+        stats["defense"], stats["speed_modifier"] = float(ar.defense), -float(ar.speed_penalty)
+        equipped_name = ar.get_display_name()
+    return equipped_name, stats
+
+
+@functools.lru_cache(maxsize=256)
 def get_item_name(item_id: str) -> str:
-    """Get the display name of any item."""
+    """Get the display name of any item (memoized; ITEM_DATABASE is static)."""
     item = get_item(item_id)
     return item.get_display_name() if item else "Unknown Item"
 
 
+# Legacy->Item mappings for unequip returns
+_ITEM_ID_FROM_WEAPON = {
+    "sword_1": "basic_sword", "sword_2": "longsword", "sword_3": "legendary_blade",
+    "sarissa_1": "macedon_sarissa_t1", "sarissa_2": "macedon_sarissa_t2", "sarissa_3": "macedon_sarissa_t3",
+    "dory_1": "greek_dory_t1", "dory_2": "greek_dory_t2",
+    "xiphos_1": "greek_xiphos_t1", "kopis_2": "greek_kopis_t2",
+    "aspis_2": "aspis_shield_t2", "pelte_shield_1": "pelte_shield_t1",
+    "khopesh_2": "ptolemaic_khopesh_t2", "egypt_spear_1": "ptolemaic_spear_t1",
+    "akinakes_1": "seleucid_akinakes_t1", "sabre_3": "hellenic_sabre_t3", "composite_bow_2": "composite_bow_t2",
+    "gladius_2": "roman_gladius_t2", "pilum_2": "roman_pilum_t2", "scutum_2": "roman_scutum_t2",
+    "carth_spear_2": "carthage_spear_t2", "carth_shortsword_1": "carthage_shortsword_t1",
+    "carth_oval_1": "carthage_oval_shield_t1", "carth_scale_2": "carthage_scale_t2",
+    "kush_longbow_2": "kush_longbow_t2", "kush_spear_1": "kush_spear_t1",
+    "maurya_spear_2": "maurya_spear_t2", "indian_composite_3": "maurya_composite_bow_t3",
+    "pontic_kopis_2": "pontic_kopis_t2", "pontic_lance_1": "pontic_light_lance_t1",
+    "rhomphaia_3": "thracian_rhomphaia_t3", "light_axe_1": "balkan_light_axe_t1",
+    # Legendary monster weapons
+    "cyclops_club": "cyclops_club",
+    "minotaur_labrys": "minotaur_labrys",
+    "boar_tusk_spear": "boar_tusk_spear",
+    "sabertooth_claws": "sabertooth_claws",
+    "centaur_lance": "centaur_lance",
+}
+
+_ITEM_ID_FROM_ARMOR = {
+    # Basic helmets
+    "helm_1": "leather_helmet", "helm_2": "chainmail_helmet", "helm_3": "plate_helmet",
+    # Basic chest pieces
+    "chest_1": "leather_armor", "chest_2": "chainmail_armor", "chest_3": "plate_armor",
+    # Basic legs
+    "legs_1": "leather_leggings", "legs_2": "chainmail_leggings", "legs_3": "plate_leggings",
+    # Basic boots
+    "boots_1": "leather_boots", "boots_2": "chainmail_boots", "boots_3": "plate_boots",
+    # Faction helmets
+    "phrygian_helm_1": "phrygian_helmet_t1",
+    "corinthian_helm_2": "corinthian_helmet_t2",
+    "illyrian_helm_1": "illyrian_helmet_t1",
+    "montefortino_helm_2": "montefortino_helmet_t2",
+    "balkan_simple_helm_1": "balkan_simple_helm_t1",
+    # Faction chest pieces
+    "muscled_cuirass_2": "muscled_cuirass_t2",
+    "linothorax_2": "linothorax_t2",
+    "lorica_hamata_3": "lorica_hamata_t3",
+    "scale_armor_2": "scale_armor_t2",
+    "lamellar_armor_3": "lamellar_armor_t3",
+    "ptolemaic_linen_bronze_2": "ptolemaic_linen_bronze_t2",
+    "kush_leather_1": "kush_leather_t1",
+    "pontic_tunic_bronze_1": "pontic_tunic_bronze_t1",
+    # Legendary monster armors
+    "dire_wolf_pelt": "dire_wolf_pelt",
+    "hydra_scale_mail": "hydra_scale_mail",
+    "nemean_lion_hide": "nemean_lion_hide",
+    "harpy_feather_cloak": "harpy_feather_cloak",
+    "gorgon_visor": "gorgon_visor",
+}
+
+
+def _equip_weapon(player, item_to_equip: items.Item, inventory: list) -> None:
+    new_weapon_id = _infer_weapon_id_from_item(item_to_equip)
+
+    # Validate that weapon ID exists
+    if get_weapon(new_weapon_id) is None:
+        from . import logger
+        logger.warning("Invalid weapon ID: %s", new_weapon_id)
+        return  # Don't equip invalid weapon
+
+    prev_weapon_id = getattr(player.equipment, "weapon", None)
+    if prev_weapon_id and prev_weapon_id in _ITEM_ID_FROM_WEAPON:
+        prev_item = _get_item_or_none(_ITEM_ID_FROM_WEAPON[prev_weapon_id])
+        if prev_item:
+            inventory.append(prev_item)
+
+    setattr(player.equipment, "weapon", new_weapon_id)
+    if item_to_equip in inventory:
+        inventory.remove(item_to_equip)
+
+
+def _equip_armor(player, item_to_equip: items.Item, inventory: list) -> None:
+    slot, target_armor_id = _infer_armor_slot_and_id_from_item(item_to_equip)
+
+    # Validate that armor ID exists
+    if get_armor(target_armor_id) is None:
+        from . import logger
+        logger.warning("Invalid armor ID: %s", target_armor_id)
+        return  # Don't equip invalid armor
+
+    prev_armor_id = getattr(player.equipment, slot, None)
+    if prev_armor_id:
+        prev_item_id = _ITEM_ID_FROM_ARMOR.get(prev_armor_id)
+        if prev_item_id:
+            prev_item = _get_item_or_none(prev_item_id)
+            if prev_item:
+                inventory.append(prev_item)
+
+    setattr(player.equipment, slot, target_armor_id)
+    if item_to_equip in inventory:
+        inventory.remove(item_to_equip)
+
+
+# ItemType -> equip handler; other item types cannot be equipped
+_EQUIP_HANDLERS = {
+    items.ItemType.WEAPON: _equip_weapon,
+    items.ItemType.ARMOR: _equip_armor,
+}
+
+
 def equip_item(player, item_to_equip: items.Item):
     """Equip an Item from the player's inventory, bridging to Equipment IDs.
 
@@ -349,182 +674,34 @@ def equip_item(player, item_to_equip: items.Item):
     if not item_to_equip or not player or not getattr(player, "equipment", None):
         return
 
-    # Legacy->Item mappings for unequip returns
-    item_id_from_weapon = {
-        "sword_1": "basic_sword", "sword_2": "longsword", "sword_3": "legendary_blade",
-        "sarissa_1": "macedon_sarissa_t1", "sarissa_2": "macedon_sarissa_t2", "sarissa_3": "macedon_sarissa_t3",
-        "dory_1": "greek_dory_t1", "dory_2": "greek_dory_t2",
-        "xiphos_1": "greek_xiphos_t1", "kopis_2": "greek_kopis_t2",
-        "aspis_2": "aspis_shield_t2", "pelte_shield_1": "pelte_shield_t1",
-        "khopesh_2": "ptolemaic_khopesh_t2", "egypt_spear_1": "ptolemaic_spear_t1",
-        "akinakes_1": "seleucid_akinakes_t1", "sabre_3": "hellenic_sabre_t3", "composite_bow_2": "composite_bow_t2",
-        "gladius_2": "roman_gladius_t2", "pilum_2": "roman_pilum_t2", "scutum_2": "roman_scutum_t2",
-        "carth_spear_2": "carthage_spear_t2", "carth_shortsword_1": "carthage_shortsword_t1",
-        "carth_oval_1": "carthage_oval_shield_t1", "carth_scale_2": "carthage_scale_t2",
-        "kush_longbow_2": "kush_longbow_t2", "kush_spear_1": "kush_spear_t1",
-        "maurya_spear_2": "maurya_spear_t2", "indian_composite_3": "maurya_composite_bow_t3",
-        "pontic_kopis_2": "pontic_kopis_t2", "pontic_lance_1": "pontic_light_lance_t1",
-        "rhomphaia_3": "thracian_rhomphaia_t3", "light_axe_1": "balkan_light_axe_t1",
-        # Legendary monster weapons
-        "cyclops_club": "cyclops_club",
-        "minotaur_labrys": "minotaur_labrys",
-        "boar_tusk_spear": "boar_tusk_spear",
-        "sabertooth_claws": "sabertooth_claws",
-        "centaur_lance": "centaur_lance",
-    }
-
-    item_id_from_armor = {
-        # Basic helmets
-        "helm_1": "leather_helmet", "helm_2": "chainmail_helmet", "helm_3": "plate_helmet",
-        # Basic chest pieces
-        "chest_1": "leather_armor", "chest_2": "chainmail_armor", "chest_3": "plate_armor",
-        # Basic legs
-        "legs_1": "leather_leggings", "legs_2": "chainmail_leggings", "legs_3": "plate_leggings",
-        # Basic boots
-        "boots_1": "leather_boots", "boots_2": "chainmail_boots", "boots_3": "plate_boots",
-        # Faction helmets
-        "phrygian_helm_1": "phrygian_helmet_t1",
-        "corinthian_helm_2": "corinthian_helmet_t2",
-        "illyrian_helm_1": "illyrian_helmet_t1",
-        "montefortino_helm_2": "montefortino_helmet_t2",
-        "balkan_simple_helm_1": "balkan_simple_helm_t1",
-        # Faction chest pieces
-        "muscled_cuirass_2": "muscled_cuirass_t2",
-        "linothorax_2": "linothorax_t2",
-        "lorica_hamata_3": "lorica_hamata_t3",
-        "scale_armor_2": "scale_armor_t2",
-        "lamellar_armor_3": "lamellar_armor_t3",
-        "ptolemaic_linen_bronze_2": "ptolemaic_linen_bronze_t2",
-        "kush_leather_1": "kush_leather_t1",
-        "pontic_tunic_bronze_1": "pontic_tunic_bronze_t1",
-        # Legendary monster armors
-        "dire_wolf_pelt": "dire_wolf_pelt",
-        "hydra_scale_mail": "hydra_scale_mail",
-        "nemean_lion_hide": "nemean_lion_hide",
-        "harpy_feather_cloak": "harpy_feather_cloak",
-        "gorgon_visor": "gorgon_visor",
-    }
+    # Preconditions instead of a blanket try/except: bail out quietly on
+    # malformed players/items; caller may surface a notification
+    inventory = getattr(player, "inventory", None)
+    if inventory is None:
+        return
+    handler = _EQUIP_HANDLERS.get(getattr(item_to_equip, "item_type", None))
+    if handler is not None:
+        handler(player, item_to_equip, inventory)
 
-    def _infer_weapon_id_from_item(it: items.Item) -> str:
-        name = getattr(it, "name", "").lower()
-        tier = max(1, min(3, getattr(it, "tier", 1)))
-        # Bandit/simple weapons mapping
-        if "wooden round shield" in name or ("round" in name and "shield" in name):
-            return "shield_1"
-        if "wooden club" in name or "club" in name:
-            return "axe_1"  # club approximated by axe profile
-        if "hand axe" in name:
-            return "axe_1"
-        if "leaf dagger" in name or "dagger" in name:
-            return "sword_1"
-        if "short spear" in name:
-            return "spear_1"
-        if "self bow" in name or ("bow" in name and tier == 1):
-            return "bow_1"
-        if "sling" in name:
-            return "bow_1"  # sling approximated by primitive ranged
-        if "sarissa" in name: return f"sarissa_{tier}"
-        if "dory" in name: return f"dory_{min(2, tier)}"
-        if "xiphos" in name: return "xiphos_1"
-        if "kopis" in name: return "kopis_2"
-        if "aspis" in name: return "aspis_2"
-        if "khopesh" in name: return "khopesh_2"
-        if "akinakes" in name: return "akinakes_1"
-        if "sabre" in name: return "sabre_3"
-        if "composite bow" in name or "bow" in name: return "composite_bow_2" if tier <= 2 else "indian_composite_3"
-        if "gladius" in name: return "gladius_2"
-        if "pilum" in name: return "pilum_2"
-        if "scutum" in name: return "scutum_2"
-        if "carthaginian long spear" in name: return "carth_spear_2"
-        if "oval shield" in name and "carthaginian" in name: return "carth_oval_1"
-        if "nubian longbow" in name: return "kush_longbow_2"
-        if "kushite short spear" in name: return "kush_spear_1"
-        if "mauryan long spear" in name: return "maurya_spear_2"
-        if "indian composite" in name: return "indian_composite_3"
-        if "pontic kopis" in name: return "pontic_kopis_2"
-        if "pontic light lance" in name: return "pontic_lance_1"
-        if "rhomphaia" in name: return "rhomphaia_3"
-        if "axe" in name: return "light_axe_1"
-        # Legendary monster weapons
-        if "cyclops" in name and "club" in name: return "cyclops_club"
-        if "minotaur" in name and "labrys" in name: return "minotaur_labrys"
-        if "boar" in name and "tusk" in name: return "boar_tusk_spear"
-        if "sabertooth" in name and "claw" in name: return "sabertooth_claws"
-        if "centaur" in name and "lance" in name: return "centaur_lance"
-        # Fallback generic
-        return {1: "sword_1", 2: "sword_2", 3: "sword_3"}[tier]
-
-    def _infer_armor_slot_and_id_from_item(it: items.Item) -> tuple[str, str]:
-        name = getattr(it, "name", "").lower()
-        tier = max(1, min(3, getattr(it, "tier", 1)))
-        # Legendary monster armors
-        if "dire wolf" in name and "pelt" in name: return ("chest", "dire_wolf_pelt")
-        if "hydra" in name and "scale" in name: return ("chest", "hydra_scale_mail")
-        if "nemean" in name and "lion" in name: return ("chest", "nemean_lion_hide")
-        if "harpy" in name and "feather" in name: return ("chest", "harpy_feather_cloak")
-        if "gorgon" in name and "visor" in name: return ("helmet", "gorgon_visor")
-        # Regular armors
-        if any(k in name for k in ["helmet", "helm", "corinth", "phryg", "illyr", "montefortino", "crest"]):
-            if "corinth" in name: return ("helmet", "corinthian_helm_2")
-            if "phryg" in name: return ("helmet", "phrygian_helm_1")
-            if "illyr" in name: return ("helmet", "illyrian_helm_1")
-            if "montefortino" in name: return ("helmet", "montefortino_helm_2")
-            return ("helmet", "balkan_simple_helm_1")
-        if any(k in name for k in ["lorica", "hamata", "linothorax", "cuirass", "scale armor", "lamellar", "armor"]):
-            if "lorica" in name or "hamata" in name: return ("chest", "lorica_hamata_3")
-            if "linothorax" in name: return ("chest", "linothorax_2")
-            if "muscled" in name or "cuirass" in name: return ("chest", "muscled_cuirass_2")
-            if "lamellar" in name: return ("chest", "lamellar_armor_3")
-            if "scale" in name: return ("chest", "scale_armor_2")
-            return ("chest", "chest_2")
-        return ("chest", {1: "chest_1", 2: "chest_2", 3: "chest_3"}[tier])
 
+def _get_item_or_none(item_id: str) -> Optional[items.Item]:
+    """Build the inventory Item for an unequipped piece, or None if its data is incomplete."""
     try:
-        if item_to_equip.item_type == items.ItemType.WEAPON:
-            new_weapon_id = _infer_weapon_id_from_item(item_to_equip)
-
-            # Validate that weapon ID exists
-            if get_weapon(new_weapon_id) is None:
-                from . import logger
-                logger.warning(f"Invalid weapon ID: {new_weapon_id}")
-                return  # Don't equip invalid weapon
-
-            prev_weapon_id = getattr(player.equipment, "weapon", None)
-            if prev_weapon_id and prev_weapon_id in item_id_from_weapon:
-                prev_item = items.get_item_by_id(item_id_from_weapon[prev_weapon_id])
-                if prev_item:
-                    player.inventory.append(prev_item)
-
-            setattr(player.equipment, "weapon", new_weapon_id)
-            if item_to_equip in player.inventory:
-                player.inventory.remove(item_to_equip)
-
-        elif item_to_equip.item_type == items.ItemType.ARMOR:
-            slot, target_armor_id = _infer_armor_slot_and_id_from_item(item_to_equip)
-
-            # Validate that armor ID exists
-            if get_armor(target_armor_id) is None:
-                from . import logger
-                logger.warning(f"Invalid armor ID: {target_armor_id}")
-                return  # Don't equip invalid armor
-
-            prev_armor_id = getattr(player.equipment, slot, None)
-            if prev_armor_id:
-                prev_item_id = item_id_from_armor.get(prev_armor_id)
-                if prev_item_id:
-                    prev_item = items.get_item_by_id(prev_item_id)
-                    if prev_item:
-                        player.inventory.append(prev_item)
-
-            setattr(player.equipment, slot, target_armor_id)
-            if item_to_equip in player.inventory:
-                player.inventory.remove(item_to_equip)
-    except Exception:
-        # Fail silently to avoid crashing the game; caller may surface a notification
-        pass
-
-
-def get_random_shop_inventory(num_items=5, faction_id: str | None = None) -> list[items.Item]:
+        return items.get_item_by_id(item_id)
+    except KeyError:
+        return None
+
+
+# Tier 1-2 pools sampled by the generic shop (built once; the database is static)
+# Tuples of ids, so random.sample draws a whole selection in one call and
+# random.seed() keeps shop stock reproducible
+_WEAPONS_POOL_T12 = tuple(k for k, v in items.ITEM_DATABASE.items()
+                          if v.kind == items.KIND_WEAPON and v.tier <= 2)
+_ARMORS_POOL_T12 = tuple(k for k, v in items.ITEM_DATABASE.items()
+                         if v.kind == items.KIND_ARMOR and v.tier <= 2)
+
+
+def get_random_shop_inventory(num_items=5, faction_id: str | None = None) -> items.ItemList:
     """Generate a random list of items for the shop.
 
     If faction_id is provided, uses `factions.roll_shop_items`.
@@ -532,22 +709,23 @@ def get_random_shop_inventory(num_items=5, faction_id: str | None = None) -> lis
     if faction_id:
         rolled = factions.roll_shop_items(faction_id, n=num_items)
         # Pad to grid size if needed by UI caller
-        return rolled
+        return items.ItemList(rolled)
 
     # Fallback: generic pool (previous behavior)
-    shop_inventory: list[items.Item] = []
+    shop_inventory = items.ItemList()
 
-    possible_weapons = [k for k, v in items.ITEM_DATABASE.items() if "damage" in v and v.get("tier", 1) <= 2]
-    possible_armors = [k for k, v in items.ITEM_DATABASE.items() if "defense" in v and v.get("tier", 1) <= 2]
+    possible_weapons = _WEAPONS_POOL_T12
+    possible_armors = _ARMORS_POOL_T12
 
     num_weapons = random.randint(2, 3)
     num_armors = max(0, num_items - num_weapons)
 
+    item_ids = []
     if possible_weapons:
-        for item_id in random.sample(possible_weapons, min(num_weapons, len(possible_weapons))):
-            shop_inventory.append(items.get_item_by_id(item_id, with_random_quality=True))
+        item_ids += random.sample(possible_weapons, min(num_weapons, len(possible_weapons)))
     if possible_armors:
-        for item_id in random.sample(possible_armors, min(num_armors, len(possible_armors))):
-            shop_inventory.append(items.get_item_by_id(item_id, with_random_quality=True))
+        item_ids += random.sample(possible_armors, min(num_armors, len(possible_armors)))
+    # Roll every quality of the stock in one batch
+    shop_inventory.extend(items.get_random_quality_items(item_ids))
 
     return shop_inventory
@@ -6,8 +6,10 @@ Mantém um registro leve e funções de rolagem. Não contem lógica pesada.
 
 from __future__ import annotations
 
+import itertools
 import random
-from typing import Dict, List, Optional
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
 
 from . import items
 
@@ -180,6 +182,33 @@ FACTIONS: Dict[str, Dict] = {
 }
 
 
+# Vista imutável por facção para leitores quentes (render): `view.primary` em
+# vez de `fac["palette"]["primary"]`. FACTIONS continua sendo a fonte (JSON).
+FactionView = namedtuple("FactionView", "name primary accent icon biome spawn shop loot")
+FACTION_VIEWS: Dict[str, FactionView] = {
+    fid: FactionView(
+        f.get("name", fid),
+        f.get("palette", {}).get("primary"),
+        f.get("palette", {}).get("accent"),
+        f.get("icon"),
+        f.get("biome"),
+        f.get("spawn_weights"),
+        f.get("shop_weights"),
+        f.get("loot_weights"),
+    )
+    for fid, f in FACTIONS.items()
+}
+
+_FACTION_IDS = frozenset(FACTIONS)
+
+# Nomes legados de facção do mundo -> id interno
+_ALIAS_MAP: Dict[str, str] = {
+    "kingdom": "greeks",
+    "bandits": "bandits",
+    "monsters": "monsters",
+}
+
+
 def list_factions() -> List[str]:
     return list(FACTIONS.keys())
 
@@ -188,54 +217,100 @@ def get_faction(fid: str) -> Optional[Dict]:
     return FACTIONS.get(fid)
 
 
-def _weighted_choice(weights: Dict[str, int]) -> Optional[str]:
-    pool = [(k, int(v)) for k, v in weights.items() if int(v) > 0]
-    if not pool:
+# Tabela de alias (Vose): (keys, prob, alias), sorteio O(1) em vez de varrer
+# os pesos a cada rolagem
+AliasTable = Tuple[List[str], List[float], List[int]]
+
+
+def _build_alias(weights: Dict[str, int]) -> AliasTable:
+    """Monta a tabela de alias de Vose; pesos <= 0 ficam de fora."""
+    keys = [k for k, v in weights.items() if int(v) > 0]
+    n = len(keys)
+    if not n:
+        return keys, [], []
+    total = sum(int(weights[k]) for k in keys)
+    scaled = [int(weights[k]) * n / total for k in keys]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, q in enumerate(scaled) if q < 1.0]
+    large = [i for i, q in enumerate(scaled) if q >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Sobras (erro de arredondamento) ficam com probabilidade 1
+    return keys, prob, alias
+
+
+def _weighted_choice(table: AliasTable, _random=random.random) -> Optional[str]:
+    keys, prob, alias = table
+    n = len(keys)
+    if not n:
         return None
-    total = sum(w for _, w in pool)
-    r = random.randint(1, total)
-    acc = 0
-    for k, w in pool:
-        acc += w
-        if r <= acc:
-            return k
-    return pool[-1][0]
+    # Um único random() escolhe a coluna (parte inteira) e decide entre ela e
+    # o alias (parte fracionária); evita o _randbelow do randrange
+    u = _random() * n
+    i = int(u)
+    return keys[i] if u - i < prob[i] else keys[alias[i]]
+
+
+# Tabelas de alias por facção, montadas uma vez no import (os pesos de
+# FACTIONS são estáticos; a loja usa _SHOP_CUM)
+_SPAWN_ALIAS: Dict[str, AliasTable] = {
+    fid: _build_alias(f["spawn_weights"]) for fid, f in FACTIONS.items() if "spawn_weights" in f
+}
+_LOOT_ALIAS: Dict[str, AliasTable] = {
+    fid: _build_alias(f["loot_weights"]) for fid, f in FACTIONS.items() if "loot_weights" in f
+}
+
+
+def _cumulative(weights: Dict[str, int]) -> Tuple[List[str], List[int]]:
+    """(keys, pesos cumulativos) para random.choices; pesos <= 0 ficam de fora."""
+    keys = [k for k, v in weights.items() if int(v) > 0]
+    return keys, list(itertools.accumulate(int(weights[k]) for k in keys))
+
+
+# Pesos cumulativos da loja por facção (só facções com algum peso positivo)
+_SHOP_CUM: Dict[str, Tuple[List[str], List[int]]] = {
+    fid: table for fid, table in
+    ((fid, _cumulative(f.get("shop_weights", {}))) for fid, f in FACTIONS.items())
+    if table[0]
+}
 
 
 def roll_enemy_type(fid: str) -> Optional[str]:
-    f = get_faction(fid)
-    if not f:
+    table = _SPAWN_ALIAS.get(fid)
+    if table is None:
         return None
-    return _weighted_choice(f.get("spawn_weights", {}))
+    return _weighted_choice(table)
 
 
 def roll_shop_items(fid: str, n: int = 6) -> List[items.Item]:
     """Retorna uma lista de Items para a loja da facção."""
-    f = get_faction(fid)
-    if not f:
+    if fid not in _FACTION_IDS:
         return []
-    result: List[items.Item] = []
-    for _ in range(n):
-        iid = _weighted_choice(f.get("shop_weights", {}))
-        if iid:
-            it = items.get_item_by_id(iid, with_random_quality=True)
-            result.append(it)
-        else:
-            result.append(None)
-    # Completa até n posições
-    while len(result) < n:
-        result.append(None)
-    return result
-
-
-def roll_loot(fid: str, tier_hint: int = 2, chance: float = 0.15) -> Optional[items.Item]:
+    table = _SHOP_CUM.get(fid)
+    if table is None:
+        # Facção sem itens de loja: n posições vazias
+        return [None] * n
+    keys, cum = table
+    # Um único sorteio em C para as n posições, e as qualidades num só lote
+    return items.get_random_quality_items(random.choices(keys, cum_weights=cum, k=n))
+
+
+def roll_loot(fid: str, tier_hint: int = 2, chance: float = 0.15,
+              _rand=random.random) -> Optional[items.Item]:
     """Rola um loot simples por inimigo derrotado com chance, ponderado pela facção."""
-    if random.random() >= chance:
+    # O teste de chance vem antes de qualquer acesso a dicts (falha ~85% das vezes)
+    if _rand() >= chance:
         return None
-    f = get_faction(fid)
-    if not f:
+    table = _LOOT_ALIAS.get(fid)
+    if table is None:
         return None
-    iid = _weighted_choice(f.get("loot_weights", {}))
+    iid = _weighted_choice(table)
     if not iid:
         return None
     return items.get_item_by_id(iid, with_random_quality=True)
@@ -243,16 +318,7 @@ def roll_loot(fid: str, tier_hint: int = 2, chance: float = 0.15) -> Optional[it
 
 def map_world_faction_to_faction_id(world_faction: str) -> str:
     """Mapeia 'kingdom'/'bandits' para facções internas (ajustável)."""
-    wf = (world_faction or "").lower()
-    # Direct match to known factions
-    if wf in FACTIONS:
-        return wf
-    # Legacy/aliases
-    if wf == "kingdom":
-        return "greeks"
-    if wf == "bandits":
-        return "bandits"
-    if wf == "monsters":
-        return "monsters"
-    # Fallback: return as-is to allow caller to decide (roll_loot will safely return None)
-    return wf
+    wf = world_faction.lower() if world_faction else ""
+    # Direct match to known factions, then legacy aliases; fallback: return
+    # as-is to allow caller to decide (roll_loot will safely return None)
+    return wf if wf in _FACTION_IDS else _ALIAS_MAP.get(wf, wf)
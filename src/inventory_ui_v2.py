@@ -19,9 +19,27 @@ Author: Henry + ChatGPT
 from __future__ import annotations
 
 import pygame
+from functools import lru_cache
 from typing import List, Optional, Callable, Dict, Tuple
 from . import items
 from . import ui_components as ui
+from .resource_manager import get_font
+
+
+@lru_cache(maxsize=256)
+def _text(font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """Render a text label once and reuse it across frames (do not draw on the result)."""
+    return font.render(text, True, color)
+
+
+# Equipped panel rows: (equipped_items key, label)
+_EQUIP_SLOTS = (
+    ("weapon", "Weapon"),
+    ("helmet", "Helmet"),
+    ("chest", "Chest"),
+    ("legs", "Legs"),
+    ("boots", "Boots"),
+)
 
 
 # =============================================================================
@@ -62,21 +80,26 @@ class UIScreen:
     # ---- Transition update -------------------------------------------------
     def _update_fade(self):
         if self._state in ("opening", "closing"):
-            now = pygame.time.get_ticks()
-            t = (now - self._transition_start) / self._fade_duration
-            t = max(0.0, min(1.0, t))
+            # Integer math: elapsed ms clamped to [0, duration], one floor divide
+            duration = self._fade_duration
+            elapsed = pygame.time.get_ticks() - self._transition_start
+            if elapsed < 0:
+                elapsed = 0
+            done = elapsed >= duration
 
             if self._state == "opening":
-                self._alpha = int(255 * t)
-                if t >= 1.0:
+                if done:
                     self._state = "open"
                     self._alpha = 255
+                else:
+                    self._alpha = (elapsed * 255) // duration
             else:  # closing
-                self._alpha = int(255 * (1.0 - t))
-                if t >= 1.0:
+                if done:
                     self._state = "closed"
                     self._alpha = 0
                     self.visible = False
+                else:
+                    self._alpha = ((duration - elapsed) * 255) // duration
         elif self._state == "open":
             self._alpha = 255
         elif self._state == "closed":
@@ -172,12 +195,12 @@ class InventoryUI(UIScreen):
         self.drop_btn = ui.Button(450, button_y, 100, 35, "Drop", font_size=18)
         self.close_btn = ui.Button(560, button_y, 100, 35, "Close", font_size=18)
 
-        # Dynamic filters (name -> predicate)
-        # Predicates receive an `item` and return True/False.
-        self.filters: Dict[str, Callable] = {
-            "all": lambda it: True,
-            "weapons": lambda it: hasattr(it, "item_type") and it.item_type == items.ItemType.WEAPON,
-            "armor": lambda it: hasattr(it, "item_type") and it.item_type == items.ItemType.ARMOR,
+        # Dynamic filters (name -> items.ITEM_TYPE_MASK bits)
+        # An item passes when `mask & item.type_mask` is non-zero.
+        self.filters: Dict[str, int] = {
+            "all": items.ITEM_TYPE_MASK_ALL,
+            "weapons": items.ITEM_TYPE_MASK[items.ItemType.WEAPON],
+            "armor": items.ITEM_TYPE_MASK[items.ItemType.ARMOR],
         }
 
         # Create buttons from filters dynamically
@@ -188,6 +211,32 @@ class InventoryUI(UIScreen):
         # State
         self.selected_index: Optional[int] = None
         self.should_close_flag: bool = False
+        # Grid cell under the mouse, computed in update() and reused by render()
+        self._hovered: Optional[int] = None
+        # Filtered items computed by update(), reused by render(); None = stale.
+        # _display_version is the inventory's ItemList.version they were
+        # filtered from
+        self._display_items: Optional[list] = None
+        self._display_version: Optional[int] = None
+        # Recomposite only when something visible changed; otherwise render()
+        # re-blits the previous _composite
+        self._dirty: bool = True
+        self._last_mouse_pos: Optional[Tuple[int, int]] = None
+        self._last_equipped: Optional[Dict[str, Optional[str]]] = None
+        # Memoized inventory weight, keyed by the inventory's ItemList.version
+        self._weight_version: Optional[int] = None
+        self._weight: float = 0.0
+
+        # Fonts (cached; constructing a Font per frame re-reads the font file)
+        self.font_text = get_font(18)
+        self.font_title = get_font(20)
+
+        # Static text of the equipped panel, rasterized once
+        self._slot_label_surfs = [
+            self.font_text.render(f"{label}:", True, ui.UIColors.TEXT_SECONDARY)
+            for _, label in _EQUIP_SLOTS
+        ]
+        self._empty_surf = self.font_text.render("Empty", True, ui.UIColors.TEXT_DISABLED)
 
         # Pre-allocated surface for whole-screen composition + fade
         self._composite = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
@@ -195,20 +244,51 @@ class InventoryUI(UIScreen):
     # ---- Helpers -----------------------------------------------------------
     def _create_filter_buttons(self, base_x: int, y: int, spacing: int = 8):
         self.filter_buttons.clear()
+        # Size each button to its measured label (same font the Button draws
+        # with) plus padding, keeping the old 70px minimum
+        probe = get_font(16)
         x = base_x
         for name in self.filters.keys():
             label = name.capitalize() if name != "weapons" else "Weapons"
-            w = max(70, 14 * len(label))
+            w = max(70, probe.size(label)[0] + 16)
             btn = ui.Button(x, y, w, 30, label, font_size=16)
             # Capture closure variable `name` safely using default arg
             btn.callback = (lambda n=name: self._set_filter(n))
             self.filter_buttons[name] = btn
             x += w + spacing
+        self._current_filter_btn: Optional[ui.Button] = self.filter_buttons.get(self.current_filter)
 
     def _set_filter(self, name: str):
         if name in self.filters:
             self.current_filter = name
+            self._current_filter_btn = self.filter_buttons.get(name)
             self.selected_index = None
+            self._display_items = None
+            self._dirty = True
+
+    def _inventory_weight(self, player) -> float:
+        """Total inventory weight, recomputed only when the inventory changed.
+
+        Only an ItemList carries a version; a plain list is summed every call.
+        """
+        inventory = player.inventory
+        version = items.list_version(inventory)
+        if version is None or version != self._weight_version:
+            self._weight_version = version
+            self._weight = sum(getattr(item, "weight", 0.0) for item in inventory if item)
+        return self._weight
+
+    def _buttons_animating(self) -> bool:
+        """True while any button is hovered, pressed or easing its hover glow."""
+        for btn in (self.equip_btn, self.drop_btn, self.close_btn, *self.filter_buttons.values()):
+            if btn.hovered or btn.pressed or btn.hover_progress > 0.0:
+                return True
+        return False
+
+    # ---- Lifecycle ---------------------------------------------------------
+    def open(self):
+        super().open()
+        self._dirty = True
 
     # ---- Public API --------------------------------------------------------
     def should_close_inventory(self) -> bool:
@@ -219,9 +299,10 @@ class InventoryUI(UIScreen):
 
     def _get_filtered_items(self, player):
         """Get filtered inventory items based on current filter."""
-        inventory = [it for it in player.inventory if it]
-        predicate = self.filters.get(self.current_filter, lambda it: True)
-        return [it for it in inventory if predicate(it)]
+        mask = self.filters.get(self.current_filter, items.ITEM_TYPE_MASK_ALL)
+        if mask == items.ITEM_TYPE_MASK_ALL:
+            return [it for it in player.inventory if it]
+        return [it for it in player.inventory if it and mask & getattr(it, "type_mask", 0)]
 
     # ---- Update ------------------------------------------------------------
     def update(self,
@@ -241,11 +322,24 @@ class InventoryUI(UIScreen):
 
         self.should_close_flag = False
 
-        # Filter inventory based on current filter
-        display_items = self._get_filtered_items(player)
+        # Filter inventory based on current filter; re-filter only when the
+        # inventory version changed (or the view was invalidated). A plain
+        # list has no version, so it is re-filtered every frame and compared
+        # by item identity
+        version = items.list_version(player.inventory)
+        display_items = self._display_items
+        if display_items is None or version is None or version != self._display_version:
+            display_items = self._get_filtered_items(player)
+            prev = self._display_items
+            if (prev is None or len(prev) != len(display_items)
+                    or any(a is not b for a, b in zip(prev, display_items))):
+                self._dirty = True
+            self._display_items = display_items
+            self._display_version = version
+        prev_selected = self.selected_index
 
         # Update grid selection (left click to select)
-        hovered = self.inv_grid.get_hovered_index(mouse_pos)
+        hovered = self._hovered = self.inv_grid.get_hovered_index(mouse_pos)
 
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -264,12 +358,14 @@ class InventoryUI(UIScreen):
                 item_to_equip = display_items[self.selected_index]
                 on_equip_callback(item_to_equip)
                 self.selected_index = None
+                self._display_items = None  # inventory changed
 
         def on_drop():
             if self.selected_index is not None and self.selected_index < len(display_items):
                 item_to_drop = display_items[self.selected_index]
                 on_drop_callback(item_to_drop)
                 self.selected_index = None
+                self._display_items = None  # inventory changed
 
         def on_close():
             self.close()
@@ -292,6 +388,9 @@ class InventoryUI(UIScreen):
         for btn in self.filter_buttons.values():
             btn.update(events, mouse_pos)
 
+        if self.selected_index != prev_selected or self._buttons_animating():
+            self._dirty = True
+
         return display_items
 
     # ---- Render ------------------------------------------------------------
@@ -301,12 +400,39 @@ class InventoryUI(UIScreen):
         if self.alpha <= 0:
             return
 
-        # Compose to an off-screen surface to apply a global alpha
-        self._composite.fill((0, 0, 0, 0))
         cs = self._composite
 
-        # Filtered view to keep render consistent with update
-        display_items = self._get_filtered_items(player)
+        # Filtered view from update(); re-filter if an action or filter change
+        # invalidated it since
+        display_items = self._display_items
+        if display_items is None:
+            display_items = self._display_items = self._get_filtered_items(player)
+            self._display_version = items.list_version(player.inventory)
+            self._dirty = True
+
+        # Weight bar (with dynamic color hints); updated every frame so its
+        # lerp/flash animation keeps running
+        total_weight = self._inventory_weight(player)
+        max_weight = 100.0
+        bar = self.weight_bar
+        bar.update(total_weight, max_weight)
+
+        # Nothing visible changed: re-blit last frame's composite. The fade
+        # alpha is applied at blit time, so fading needs no recomposite.
+        if (not self._dirty
+                and mouse_pos == self._last_mouse_pos
+                and equipped_items == self._last_equipped
+                and bar.displayed_value == bar.current_value
+                and not bar.damage_flash and not bar.heal_flash):
+            cs.set_alpha(self.alpha)
+            screen.blit(cs, (0, 0))
+            return
+        self._dirty = False
+        self._last_mouse_pos = mouse_pos
+        self._last_equipped = dict(equipped_items)
+
+        # Compose to an off-screen surface to apply a global alpha
+        cs.fill((0, 0, 0, 0))
 
         # Panels
         self.panel.render(cs)
@@ -332,15 +458,12 @@ class InventoryUI(UIScreen):
                 self._render_item_stats(cs, selected_item)
 
         # Tooltip for hovered item
-        hovered = self.inv_grid.get_hovered_index(mouse_pos)
+        hovered = self._hovered
         if hovered is not None and hovered < len(display_items) and display_items[hovered]:
             ui.Tooltip.render(cs, display_items[hovered], mouse_pos)
 
-        # Weight bar (with dynamic color hints)
-        total_weight = sum(getattr(item, "weight", 0.0) for item in player.inventory if item)
-        max_weight = 100.0
-        self.weight_bar.update(total_weight, max_weight)
-        self.weight_bar.render(cs)
+        # Weight bar
+        bar.render(cs)
 
         # Action buttons
         self.equip_btn.render(cs)
@@ -352,52 +475,42 @@ class InventoryUI(UIScreen):
             btn.render(cs)
 
         # Highlight current filter with outline
-        for name, btn in self.filter_buttons.items():
-            if name == self.current_filter:
-                pygame.draw.rect(cs, ui.UIColors.TEXT_HIGHLIGHT, btn.rect, 2, border_radius=4)
+        if self._current_filter_btn is not None:
+            pygame.draw.rect(cs, ui.UIColors.TEXT_HIGHLIGHT, self._current_filter_btn.rect, 2, border_radius=4)
 
         # Instructions footer
-        font = pygame.font.Font(None, 18)
+        font = self.font_text
         instr = "Click item to select • ESC or I to close • Use filters to sort"
-        instr_surf = font.render(instr, True, ui.UIColors.TEXT_SECONDARY)
+        instr_surf = _text(font, instr, ui.UIColors.TEXT_SECONDARY)
         cs.blit(instr_surf, (70, self.screen_height - 80))
 
-        # Apply global fade alpha to the composed surface
-        faded = cs.copy()
-        faded.set_alpha(self.alpha)
-        screen.blit(faded, (0, 0))
+        # Apply global fade alpha directly on the preallocated surface (surface
+        # alpha combines with per-pixel alpha), no per-frame copy
+        cs.set_alpha(self.alpha)
+        screen.blit(cs, (0, 0))
 
     # ---- Private renderers -------------------------------------------------
     def _render_equipped(self, screen: pygame.Surface, equipped: Dict[str, Optional[str]]):
-        font = pygame.font.Font(None, 18)
+        font = self.font_text
         y = 130
 
-        slots = [
-            ("Weapon", equipped.get("weapon")),
-            ("Helmet", equipped.get("helmet")),
-            ("Chest", equipped.get("chest")),
-            ("Legs", equipped.get("legs")),
-            ("Boots", equipped.get("boots")),
-        ]
-
-        for slot_name, item_name in slots:
+        for (slot, _), label_surf in zip(_EQUIP_SLOTS, self._slot_label_surfs):
             # Slot label
-            label_surf = font.render(f"{slot_name}:", True, ui.UIColors.TEXT_SECONDARY)
             screen.blit(label_surf, (85, y))
 
             # Item name or Empty
+            item_name = equipped.get(slot)
             if item_name and item_name != "None":
-                item_surf = font.render(str(item_name), True, ui.UIColors.TEXT_PRIMARY)
+                item_surf = _text(font, str(item_name), ui.UIColors.TEXT_PRIMARY)
                 screen.blit(item_surf, (160, y))
             else:
-                empty_surf = font.render("Empty", True, ui.UIColors.TEXT_DISABLED)
-                screen.blit(empty_surf, (160, y))
+                screen.blit(self._empty_surf, (160, y))
 
             y += 25
 
     def _render_item_stats(self, screen: pygame.Surface, item):
-        font_title = pygame.font.Font(None, 20)
-        font_text = pygame.font.Font(None, 18)
+        font_title = self.font_title
+        font_text = self.font_text
 
         x = self.stats_panel.rect.x + 15
         y = self.stats_panel.rect.y + 40
@@ -405,7 +518,7 @@ class InventoryUI(UIScreen):
         # Item name with quality color
         name = item.get_display_name() if hasattr(item, 'get_display_name') else getattr(item, 'name', 'Unknown')
         tier_color = item.get_tier_color() if hasattr(item, 'get_tier_color') else ui.UIColors.TEXT_HIGHLIGHT
-        name_surf = font_title.render(name, True, tier_color)
+        name_surf = _text(font_title, name, tuple(tier_color))
         screen.blit(name_surf, (x, y))
         y += 30
 
@@ -415,13 +528,13 @@ class InventoryUI(UIScreen):
 
             if stats.get('damage'):
                 dmg_text = f"Damage: +{int(stats['damage'] * 12)}"
-                dmg_surf = font_text.render(dmg_text, True, ui.UIColors.SUCCESS)
+                dmg_surf = _text(font_text, dmg_text, ui.UIColors.SUCCESS)
                 screen.blit(dmg_surf, (x, y))
                 y += 22
 
             if stats.get('defense'):
                 def_text = f"Defense: +{int(stats['defense'])}"
-                def_surf = font_text.render(def_text, True, ui.UIColors.INFO)
+                def_surf = _text(font_text, def_text, ui.UIColors.INFO)
                 screen.blit(def_surf, (x, y))
                 y += 22
 
@@ -429,15 +542,15 @@ class InventoryUI(UIScreen):
                 spd_val = stats['speed_modifier'] * 100
                 spd_text = f"Speed: {spd_val:+.0f}%"
                 spd_color = ui.UIColors.ERROR if spd_val < 0 else ui.UIColors.SUCCESS
-                spd_surf = font_text.render(spd_text, True, spd_color)
+                spd_surf = _text(font_text, spd_text, spd_color)
                 screen.blit(spd_surf, (x, y))
                 y += 22
 
         # Weight & Durability
         y += 10
         if hasattr(item, 'weight'):
-            weight_surf = font_text.render(f"Weight: {getattr(item, 'weight', 0.0):.1f}kg",
-                                           True, ui.UIColors.TEXT_SECONDARY)
+            weight_surf = _text(font_text, f"Weight: {getattr(item, 'weight', 0.0):.1f}kg",
+                                ui.UIColors.TEXT_SECONDARY)
             screen.blit(weight_surf, (x, y))
             y += 22
 
@@ -446,12 +559,12 @@ class InventoryUI(UIScreen):
             dur_color = ui.UIColors.SUCCESS if dur_val > 50 else ui.UIColors.WARNING
             if dur_val < 25:
                 dur_color = ui.UIColors.ERROR
-            dur_surf = font_text.render(f"Condition: {int(dur_val)}%", True, dur_color)
+            dur_surf = _text(font_text, f"Condition: {int(dur_val)}%", dur_color)
             screen.blit(dur_surf, (x, y))
             y += 22
 
         # Value
         y += 10
         value = item.get_value() if hasattr(item, 'get_value') else getattr(item, 'base_value', 0)
-        val_surf = font_text.render(f"Value: {value}g", True, ui.UIColors.TEXT_HIGHLIGHT)
+        val_surf = _text(font_text, f"Value: {value}g", ui.UIColors.TEXT_HIGHLIGHT)
         screen.blit(val_surf, (x, y))
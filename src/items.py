@@ -4,10 +4,14 @@ Advanced Item System with Quality, Durability, Weight, and Modifiers.
 Supports Mount & Blade / Kenshi style inventory management.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from bisect import bisect
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional
+import itertools
 import random
+import sys
 
 
 class ItemQuality(Enum):
@@ -27,7 +31,49 @@ class ItemType(Enum):
     QUEST = "Quest"
 
 
-@dataclass
+# Value -> member maps of the enums; a plain dict hit skips EnumMeta.__call__
+_ITEM_TYPE_BY_VALUE = ItemType._value2member_map_
+_QUALITY_BY_VALUE = ItemQuality._value2member_map_
+
+# One bit per ItemType, so a set of categories is a single int and a filter is
+# `mask & item.type_mask`
+ITEM_TYPE_MASK = {item_type: 1 << i for i, item_type in enumerate(ItemType)}
+ITEM_TYPE_MASK_ALL = (1 << len(ItemType)) - 1
+
+# Integer quality codes (declaration order), so hot paths index tuples instead
+# of hashing/comparing enum members
+_QUALITY_TO_IDX = {q: i for i, q in enumerate(ItemQuality)}
+_NORMAL_Q = _QUALITY_TO_IDX[ItemQuality.NORMAL]
+
+# Quality multipliers, indexed by quality code (POOR, NORMAL, FINE, MASTERWORK)
+_QUALITY_STAT_MULT = (0.8, 1.0, 1.1, 1.2)
+_QUALITY_VALUE_MULT = (0.6, 1.0, 1.5, 2.0)
+
+# Tier colors indexed by tier (Bronze, Silver, Gold); index 0 is the default
+_DEFAULT_TIER_COLOR = (200, 200, 200)
+_TIER_COLORS = (
+    _DEFAULT_TIER_COLOR,
+    (205, 127, 50),   # Bronze
+    (192, 192, 192),  # Silver
+    (255, 215, 0),    # Gold
+)
+
+# Icon colors. Every item color comes from this small palette, so items share
+# these tuples instead of each holding its own copy (from_dict maps loaded
+# colors back onto them)
+_ICON_WEAPON = (220, 180, 140)      # Tan
+_ICON_ARMOR = (160, 160, 180)       # Steel blue
+_ICON_CONSUMABLE = (100, 255, 100)  # Green
+_ICON_DEFAULT = (200, 200, 200)
+_PALETTE = (_ICON_WEAPON, _ICON_ARMOR, _ICON_CONSUMABLE, *_TIER_COLORS[1:], _ICON_DEFAULT)
+_PALETTE_SHARED = {c: c for c in _PALETTE}
+
+# Random quality roll: 15% Poor, 50% Normal, 30% Fine, 5% Masterwork
+_QUALITIES = (ItemQuality.POOR, ItemQuality.NORMAL, ItemQuality.FINE, ItemQuality.MASTERWORK)
+_QUALITY_CUM_WEIGHTS = (0.15, 0.65, 0.95, 1.0)
+
+
+@dataclass(slots=True)
 class Item:
     """
     Enhanced item with quality, durability, weight, and description.
@@ -55,41 +101,66 @@ class Item:
     stack_size: int = 1  # For consumables/materials
 
     # Visual
-    icon_color: tuple = (200, 200, 200)  # RGB color for icon
+    icon_color: tuple = _ICON_DEFAULT  # RGB color for icon
 
-    def get_effective_stats(self) -> dict:
-        """Calculate actual stats after quality and durability modifiers."""
-        quality_mult = {
-            ItemQuality.POOR: 0.8,
-            ItemQuality.NORMAL: 1.0,
-            ItemQuality.FINE: 1.1,
-            ItemQuality.MASTERWORK: 1.2
-        }[self.quality]
+    # Derived: ITEM_TYPE_MASK bit of item_type
+    type_mask: int = field(init=False, repr=False, compare=False)
+
+    # Derived: _QUALITY_TO_IDX code of quality (quality is fixed at creation)
+    _q_code: int = field(init=False, repr=False, compare=False)
+
+    # Derived: display name and tier color (name, quality and tier are fixed
+    # at creation)
+    _display_name: str = field(init=False, repr=False, compare=False)
+    _tier_color: tuple = field(init=False, repr=False, compare=False)
+
+    # Derived: durability lost per unit of degrade(); 0 for quest items
+    _degrade_factor: float = field(init=False, repr=False, compare=False)
+
+    # Cached get_effective_stats() result and the (quality code, durability)
+    # it was computed for
+    _stats: Optional[Mapping] = field(default=None, init=False, repr=False, compare=False)
+    _stats_key: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.type_mask = ITEM_TYPE_MASK.get(self.item_type, 0)
+        self._q_code = q_code = _QUALITY_TO_IDX[self.quality]
+        self._display_name = self.name if q_code == _NORMAL_Q else f"{self.quality.value} {self.name}"
+        tier = self.tier
+        self._tier_color = _TIER_COLORS[tier] if 0 <= tier < 4 else _DEFAULT_TIER_COLOR
+        self._degrade_factor = 0.0 if self.is_quest_item else 1.0
+
+    def get_effective_stats(self) -> Mapping:
+        """Calculate actual stats after quality and durability modifiers.
+
+        The result is cached until quality or durability changes, so it is
+        returned read-only.
+        """
+        key = (self._q_code, self.durability)
+        if self._stats is not None and self._stats_key == key:
+            return self._stats
+
+        quality_mult = _QUALITY_STAT_MULT[self._q_code]
 
         durability_mult = max(0.5, self.durability / 100.0)  # Min 50% effectiveness
 
         final_mult = quality_mult * durability_mult
 
-        return {
+        self._stats_key = key
+        self._stats = MappingProxyType({
             "damage": self.damage * final_mult if self.damage else None,
             "defense": self.defense * final_mult if self.defense else None,
             "speed_modifier": self.speed_modifier,  # Speed not affected
-        }
+        })
+        return self._stats
 
     def get_display_name(self) -> str:
         """Get full display name with quality prefix."""
-        if self.quality == ItemQuality.NORMAL:
-            return self.name
-        return f"{self.quality.value} {self.name}"
+        return self._display_name
 
     def get_value(self) -> int:
         """Get actual gold value based on quality and durability."""
-        quality_mult = {
-            ItemQuality.POOR: 0.6,
-            ItemQuality.NORMAL: 1.0,
-            ItemQuality.FINE: 1.5,
-            ItemQuality.MASTERWORK: 2.0
-        }[self.quality]
+        quality_mult = _QUALITY_VALUE_MULT[self._q_code]
 
         durability_mult = max(0.3, self.durability / 100.0)  # Min 30% value
 
@@ -101,21 +172,17 @@ class Item:
 
     def get_tier_color(self) -> tuple:
         """Get color based on tier (Bronze, Silver, Gold)."""
-        tier_colors = {
-            1: (205, 127, 50),   # Bronze
-            2: (192, 192, 192),  # Silver
-            3: (255, 215, 0),    # Gold
-        }
-        return tier_colors.get(self.tier, (200, 200, 200))
+        return self._tier_color
 
     def degrade(self, amount: float = 1.0):
-        """Reduce durability by amount."""
-        if not self.is_quest_item:
-            self.durability = max(0.0, self.durability - amount)
+        """Reduce durability by amount (quest items never degrade)."""
+        self.durability = max(0.0, self.durability - amount * self._degrade_factor)
+        self._stats = None
 
     def repair(self, amount: float = 50.0):
         """Restore durability by amount."""
         self.durability = min(100.0, self.durability + amount)
+        self._stats = None
 
     def is_broken(self) -> bool:
         """Check if item is completely broken."""
@@ -139,33 +206,186 @@ class Item:
             "is_equipped": self.is_equipped,
             "is_quest_item": self.is_quest_item,
             "stack_size": self.stack_size,
-            "icon_color": list(self.icon_color) if isinstance(self.icon_color, tuple) else self.icon_color,
+            "icon_color": list(self.icon_color),
         }
 
     @staticmethod
     def from_dict(data: dict) -> "Item":
         """Recreate an Item from a dict produced by to_dict."""
-        # Map strings back to enums
-        t = ItemType(data.get("item_type", ItemType.WEAPON.value))
-        q = ItemQuality(data.get("quality", ItemQuality.NORMAL.value))
-        it = Item(
-            name=data.get("name", "Unknown"),
+        g = data.get
+        # Map strings back to enums (the constructors only run for unknown
+        # values, to raise the usual ValueError)
+        t = _ITEM_TYPE_BY_VALUE.get(g("item_type", "Weapon"))
+        if t is None:
+            t = ItemType(g("item_type"))
+        q = _QUALITY_BY_VALUE.get(g("quality", "Normal"))
+        if q is None:
+            q = ItemQuality(g("quality"))
+
+        # Saves written by to_dict already hold the right types; only cast
+        # values that are not (older or hand-edited saves)
+        base_value = g("base_value", 0)
+        weight = g("weight", 1.0)
+        durability = g("durability", 100.0)
+        tier = g("tier", 1)
+        is_equipped = g("is_equipped", False)
+        is_quest_item = g("is_quest_item", False)
+        stack_size = g("stack_size", 1)
+        icon_color = tuple(g("icon_color", _ICON_DEFAULT))
+
+        return Item(
+            name=g("name", "Unknown"),
             item_type=t,
-            base_value=int(data.get("base_value", 0)),
-            weight=float(data.get("weight", 1.0)),
-            description=data.get("description", ""),
+            base_value=base_value if type(base_value) is int else int(base_value),
+            weight=weight if type(weight) is float else float(weight),
+            description=g("description", ""),
             quality=q,
-            durability=float(data.get("durability", 100.0)),
-            damage=data.get("damage"),
-            defense=data.get("defense"),
-            speed_modifier=data.get("speed_modifier"),
-            tier=int(data.get("tier", 1)),
-            is_equipped=bool(data.get("is_equipped", False)),
-            is_quest_item=bool(data.get("is_quest_item", False)),
-            stack_size=int(data.get("stack_size", 1)),
-            icon_color=tuple(data.get("icon_color", (200, 200, 200))),
+            durability=durability if type(durability) is float else float(durability),
+            damage=g("damage"),
+            defense=g("defense"),
+            speed_modifier=g("speed_modifier"),
+            tier=tier if type(tier) is int else int(tier),
+            is_equipped=is_equipped if type(is_equipped) is bool else bool(is_equipped),
+            is_quest_item=is_quest_item if type(is_quest_item) is bool else bool(is_quest_item),
+            stack_size=stack_size if type(stack_size) is int else int(stack_size),
+            icon_color=_PALETTE_SHARED.get(icon_color, icon_color),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ItemTemplate:
+    """Immutable data shared by every Item built from one database entry.
+
+    Items instantiated from a template reference the template's objects
+    (strings, icon tuple, weight) instead of rebuilding them; only quality,
+    durability and equipped state differ per instance.
+    """
+    name: str
+    item_type: ItemType
+    base_value: int
+    weight: float
+    description: str
+    damage: Optional[float]
+    defense: Optional[float]
+    speed_modifier: Optional[float]
+    tier: int
+    stack_size: int
+    icon_color: tuple
+
+    @classmethod
+    def from_item(cls, item: Item) -> "ItemTemplate":
+        """Capture the immutable fields of a freshly created item."""
+        return cls(item.name, item.item_type, item.base_value, item.weight,
+                   item.description, item.damage, item.defense, item.speed_modifier,
+                   item.tier, item.stack_size, item.icon_color)
+
+    def instantiate(self, quality: ItemQuality = ItemQuality.NORMAL) -> Item:
+        """Create a new Item from this template."""
+        return Item(
+            name=self.name,
+            item_type=self.item_type,
+            base_value=self.base_value,
+            weight=self.weight,
+            description=self.description,
+            quality=quality,
+            damage=self.damage,
+            defense=self.defense,
+            speed_modifier=self.speed_modifier,
+            tier=self.tier,
+            stack_size=self.stack_size,
+            icon_color=self.icon_color,
         )
-        return it
+
+
+# ============================================================================
+# ITEM LISTS
+# ============================================================================
+
+# Source of ItemList versions, shared by all lists so no two lists (or two
+# states of one list) ever carry the same version
+_next_version = itertools.count(1).__next__
+
+
+class ItemList(list):
+    """List of items (inventory, shop stock) that stamps every mutation.
+
+    `version` takes a fresh value from a module-wide counter when the list is
+    created and on every change, so caches keyed on it need no other
+    signature: a version identifies one list in one state, even after the
+    list is freed and its id() reused. Call touch() after changing an item in
+    place (degrade/repair).
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.version = _next_version()
+
+    def touch(self):
+        """Mark the list changed without mutating it."""
+        self.version = _next_version()
+
+    def __reduce__(self):
+        # Copies and unpickled lists are new lists: rebuild through __init__
+        # so they get a fresh version instead of the original's
+        return (ItemList, (list(self),))
+
+    def append(self, item):
+        super().append(item)
+        self.version = _next_version()
+
+    def extend(self, iterable):
+        super().extend(iterable)
+        self.version = _next_version()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.version = _next_version()
+
+    def remove(self, item):
+        super().remove(item)
+        self.version = _next_version()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self.version = _next_version()
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version = _next_version()
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self.version = _next_version()
+
+    def reverse(self):
+        super().reverse()
+        self.version = _next_version()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.version = _next_version()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.version = _next_version()
+
+    def __iadd__(self, other):
+        super().__iadd__(other)
+        self.version = _next_version()
+        return self
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self.version = _next_version()
+        return self
+
+
+def list_version(item_list: list) -> Optional[int]:
+    """Version of an ItemList, or None for a plain list (never cacheable)."""
+    return getattr(item_list, "version", None)
 
 
 # ============================================================================
@@ -188,7 +408,7 @@ def create_weapon(name: str, tier: int, damage: float, speed_mod: float,
         damage=damage,
         speed_modifier=speed_mod,
         tier=tier,
-        icon_color=(220, 180, 140)  # Tan for weapons
+        icon_color=_ICON_WEAPON
     )
 
 
@@ -208,7 +428,7 @@ def create_armor(name: str, tier: int, defense: float, speed_penalty: float,
         defense=defense,
         speed_modifier=-speed_penalty,
         tier=tier,
-        icon_color=(160, 160, 180)  # Steel blue for armor
+        icon_color=_ICON_ARMOR
     )
 
 
@@ -222,50 +442,70 @@ def create_consumable(name: str, base_value: int, stack_size: int = 1,
         weight=0.2,  # Light
         description=description,
         stack_size=stack_size,
-        icon_color=(100, 255, 100)  # Green for consumables
+        icon_color=_ICON_CONSUMABLE
     )
 
 
+def _roll_qualities(n: int) -> list:
+    """Roll n random qualities (one random() draw each, same odds as _roll_quality)."""
+    _random = random.random
+    return [_QUALITIES[bisect(_QUALITY_CUM_WEIGHTS, _random())] for _ in range(n)]
+
+
+def _roll_quality() -> ItemQuality:
+    """Roll a single random quality."""
+    roll = random.random()
+    if roll < 0.15:
+        return ItemQuality.POOR
+    if roll < 0.65:
+        return ItemQuality.NORMAL
+    if roll < 0.95:
+        return ItemQuality.FINE
+    return ItemQuality.MASTERWORK
+
+
 def create_random_quality_weapon(name: str, tier: int, damage: float,
                                  speed_mod: float, base_value: int,
                                  description: str = "") -> Item:
     """Create a weapon with random quality."""
-    # 50% Normal, 30% Fine, 15% Poor, 5% Masterwork
-    roll = random.random()
-    if roll < 0.15:
-        quality = ItemQuality.POOR
-    elif roll < 0.65:
-        quality = ItemQuality.NORMAL
-    elif roll < 0.95:
-        quality = ItemQuality.FINE
-    else:
-        quality = ItemQuality.MASTERWORK
-
-    return create_weapon(name, tier, damage, speed_mod, base_value, description, quality)
+    return create_weapon(name, tier, damage, speed_mod, base_value, description, _roll_quality())
 
 
 def create_random_quality_armor(name: str, tier: int, defense: float,
                                 speed_penalty: float, base_value: int,
                                 description: str = "") -> Item:
     """Create armor with random quality."""
-    roll = random.random()
-    if roll < 0.15:
-        quality = ItemQuality.POOR
-    elif roll < 0.65:
-        quality = ItemQuality.NORMAL
-    elif roll < 0.95:
-        quality = ItemQuality.FINE
-    else:
-        quality = ItemQuality.MASTERWORK
-
-    return create_armor(name, tier, defense, speed_penalty, base_value, description, quality)
+    return create_armor(name, tier, defense, speed_penalty, base_value, description, _roll_quality())
 
 
 # ============================================================================
 # ITEM DATABASE
 # ============================================================================
 
-ITEM_DATABASE = {
+# Kinds of database entries
+KIND_WEAPON = 0
+KIND_ARMOR = 1
+KIND_CONSUMABLE = 2
+
+
+class ItemRecord(NamedTuple):
+    """One ITEM_DATABASE entry.
+
+    stat is damage for weapons and defense for armor; speed is the weapon
+    speed modifier or the armor speed penalty. Both are 0.0 for consumables,
+    which are always tier 1.
+    """
+    name: str
+    tier: int
+    stat: float
+    speed: float
+    value: int
+    desc: str
+    kind: int
+
+
+# Authoring format: one dict per item, converted to ItemRecords below
+_ITEM_ENTRIES = {
     # WEAPONS - Swords
     "basic_sword": {
         "name": "Iron Sword",
@@ -628,39 +868,91 @@ ITEM_DATABASE = {
 }
 
 
-def get_item_by_id(item_id: str, with_random_quality: bool = False) -> Optional[Item]:
-    """Get an item from the database by ID."""
-    if item_id not in ITEM_DATABASE:
-        return None
-
-    data = ITEM_DATABASE[item_id]
+def _to_record(data: dict) -> ItemRecord:
+    """Classify an authoring entry and pack it into an ItemRecord."""
+    desc = data.get("desc", "")
 
     # Weapons
     if "damage" in data:
-        if with_random_quality:
-            return create_random_quality_weapon(
-                data["name"], data["tier"], data["damage"],
-                data["speed_mod"], data["value"], data.get("desc", "")
-            )
-        return create_weapon(
-            data["name"], data["tier"], data["damage"],
-            data["speed_mod"], data["value"], data.get("desc", "")
-        )
+        return ItemRecord(data["name"], data["tier"], data["damage"],
+                          data["speed_mod"], data["value"], desc, KIND_WEAPON)
 
     # Armor
-    elif "defense" in data:
-        if with_random_quality:
-            return create_random_quality_armor(
-                data["name"], data["tier"], data["defense"],
-                data["speed_penalty"], data["value"], data.get("desc", "")
-            )
-        return create_armor(
-            data["name"], data["tier"], data["defense"],
-            data["speed_penalty"], data["value"], data.get("desc", "")
-        )
+    if "defense" in data:
+        return ItemRecord(data["name"], data["tier"], data["defense"],
+                          data["speed_penalty"], data["value"], desc, KIND_ARMOR)
 
     # Consumables
+    return ItemRecord(data["name"], 1, 0.0, 0.0, data["value"], desc, KIND_CONSUMABLE)
+
+
+# Intern the ids so lookups with interned keys (all literal ids in loot/shop
+# tables) match by pointer; ids built at runtime (e.g. read from a save)
+# should be passed through sys.intern() too
+ITEM_DATABASE: Dict[str, ItemRecord] = {
+    sys.intern(k): _to_record(v) for k, v in _ITEM_ENTRIES.items()
+}
+del _ITEM_ENTRIES
+
+
+def _build_template(rec: ItemRecord) -> ItemTemplate:
+    """Build the shared template of a database record."""
+    if rec.kind == KIND_WEAPON:
+        item = create_weapon(rec.name, rec.tier, rec.stat, rec.speed, rec.value, rec.desc)
+    elif rec.kind == KIND_ARMOR:
+        item = create_armor(rec.name, rec.tier, rec.stat, rec.speed, rec.value, rec.desc)
     else:
-        return create_consumable(
-            data["name"], data["value"], 1, data.get("desc", "")
-        )
+        item = create_consumable(rec.name, rec.value, 1, rec.desc)
+    return ItemTemplate.from_item(item)
+
+
+# ITEM_DATABASE is static, so every entry's flyweight template is prebuilt
+# once at import
+_TEMPLATES: Dict[str, ItemTemplate] = {
+    item_id: _build_template(rec) for item_id, rec in ITEM_DATABASE.items()
+}
+
+
+def _make_normal(tpl: ItemTemplate) -> Item:
+    return tpl.instantiate()
+
+
+def _make_random_quality(tpl: ItemTemplate) -> Item:
+    return tpl.instantiate(_roll_quality())
+
+
+# Item factory indexed by kind * 2 + with_random_quality; consumables never
+# roll a quality
+_FACTORIES = (
+    _make_normal, _make_random_quality,   # KIND_WEAPON
+    _make_normal, _make_random_quality,   # KIND_ARMOR
+    _make_normal, _make_normal,           # KIND_CONSUMABLE
+)
+
+
+def get_item_by_id(item_id: str, with_random_quality: bool = False) -> Optional[Item]:
+    """Get an item from the database by ID."""
+    rec = ITEM_DATABASE.get(item_id)
+    if rec is None:
+        return None
+    return _FACTORIES[rec.kind * 2 + bool(with_random_quality)](_TEMPLATES[item_id])
+
+
+def get_random_quality_items(item_ids) -> list:
+    """Get database items by ID, each with a random quality.
+
+    Batch form of get_item_by_id(item_id, True) for shop stock: all qualities
+    are rolled by one _roll_qualities call. Unknown IDs give None and
+    consumables keep Normal quality.
+    """
+    result = []
+    append = result.append
+    for item_id, quality in zip(item_ids, _roll_qualities(len(item_ids))):
+        rec = ITEM_DATABASE.get(item_id)
+        if rec is None:
+            append(None)
+        elif rec.kind == KIND_CONSUMABLE:
+            append(_TEMPLATES[item_id].instantiate())
+        else:
+            append(_TEMPLATES[item_id].instantiate(quality))
+    return result
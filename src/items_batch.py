@@ -0,0 +1,109 @@
+"""Bulk item stat kernels over parallel arrays.
+
+The shop screen shows a price for every item in its stock; calling
+Item.get_value per item per frame is interpreter bound. pack_items() turns a
+list of Items into parallel NumPy arrays once (whenever the list changes) and
+values_batch() computes the whole price column in one pass, compiled by Numba
+when it is available.
+
+Empty slots (None) are packed as zero rows so array index i always matches
+list index i. InventoryView keeps those arrays alongside a live item list and
+repacks them only when the list's ItemList.version changes.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Numba is optional: when installed, the kernels below are compiled to native
+# code; otherwise they run as plain vectorized NumPy.
+try:
+    from numba import njit
+except ImportError:
+    def njit(**_kwargs):
+        return lambda func: func
+
+from .items import Item, list_version, _NORMAL_Q, _QUALITY_TO_IDX, _QUALITY_VALUE_MULT
+
+# ItemQuality -> row of the multiplier arrays (same codes as Item._q_code)
+QUALITY_INDEX = _QUALITY_TO_IDX
+QUALITY_VALUE_MULT = np.array(_QUALITY_VALUE_MULT, dtype=np.float64)
+
+
+def pack_items(item_list: List[Optional[Item]]) -> Tuple[np.ndarray, ...]:
+    """Pack items into parallel arrays for the batch kernels.
+
+    Args:
+        item_list: Items (None entries allowed)
+
+    Returns:
+        (quality_idx, durability, base_value)
+    """
+    n = len(item_list)
+    quality_idx = np.full(n, _NORMAL_Q, dtype=np.int64)
+    durability = np.zeros(n, dtype=np.float64)
+    base_value = np.zeros(n, dtype=np.float64)
+    for i, it in enumerate(item_list):
+        if it is None:
+            continue
+        quality_idx[i] = it._q_code
+        durability[i] = it.durability
+        base_value[i] = it.base_value
+    return quality_idx, durability, base_value
+
+
+@njit(cache=True)
+def values_batch(quality_idx: np.ndarray, durability: np.ndarray,
+                 base_value: np.ndarray) -> np.ndarray:
+    """Batch Item.get_value: gold value after quality and durability.
+
+    No fastmath here: the result is truncated to int like get_value, so the
+    multiplication order must match it exactly.
+
+    Args:
+        quality_idx: QUALITY_INDEX codes
+        durability: Durability (0-100)
+        base_value: Base gold values
+
+    Returns:
+        int64 gold values
+    """
+    return (base_value * QUALITY_VALUE_MULT[quality_idx]
+            * np.maximum(0.3, durability / 100.0)).astype(np.int64)
+
+
+class InventoryView:
+    """Packed price columns kept alongside a live item list (shop stock).
+
+    Columns are repacked lazily when the list's ItemList.version changes
+    (a plain list has no version and is repacked on every access). After
+    mutating an item in place (degrade/repair), call the list's touch() or
+    invalidate() here. Item objects stay in `items` for the detail views.
+    """
+
+    def __init__(self, item_list: List[Optional[Item]]):
+        self.items = item_list
+        self._version: Optional[int] = None
+        self._values: Optional[np.ndarray] = None
+        self.refresh()
+
+    def invalidate(self):
+        """Force a repack on the next access."""
+        self._version = None
+
+    def refresh(self) -> bool:
+        """Repack the columns if the list changed. Returns True if repacked."""
+        version = list_version(self.items)
+        if version is not None and version == self._version:
+            return False
+        self._version = version
+        self.quality_idx, self.durability, self.base_value = pack_items(self.items)
+        self._values = None
+        return True
+
+    def values(self) -> np.ndarray:
+        """Gold value per slot (Item.get_value), 0 for empty slots."""
+        self.refresh()
+        if self._values is None:
+            self._values = values_batch(self.quality_idx, self.durability, self.base_value)
+        return self._values
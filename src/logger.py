@@ -52,6 +52,10 @@ class GameLogger:
 
         GameLogger._initialized = True
 
+        # Module name -> logger; logging.getLogger takes the logging module
+        # lock on every call, so each logger is resolved only once
+        self._loggers: dict[str, logging.Logger] = {}
+
         # Create logs directory
         self.log_dir = Path("logs")
         self.log_dir.mkdir(exist_ok=True)
@@ -119,7 +123,10 @@ class GameLogger:
         Returns:
             Configured logger instance
         """
-        return logging.getLogger(f"rpg.{name}")
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = logging.getLogger(f"rpg.{name}")
+        return logger
 
     def set_level(self, level: str):
         """Change console logging level.
@@ -175,27 +182,38 @@ def set_log_level(level: str):
     _game_logger.set_level(level)
 
 
-# Convenience functions for quick logging without creating logger
-def debug(message: str, module: str = "game"):
+# Convenience functions for quick logging without creating logger. They read
+# the logger cache directly; extra positional args are passed through as
+# %-style arguments so the message is only formatted if the record is
+# emitted (Logger.debug etc. already check the level). In hot loops prefer a
+# module-level get_logger(__name__) logger
+_logger_cache = _game_logger._loggers
+
+
+def _cached_logger(module: str) -> logging.Logger:
+    return _logger_cache.get(module) or _game_logger.get_logger(module)
+
+
+def debug(message: str, *args, module: str = "game"):
     """Quick debug log."""
-    get_logger(module).debug(message)
+    _cached_logger(module).debug(message, *args)
 
 
-def info(message: str, module: str = "game"):
+def info(message: str, *args, module: str = "game"):
     """Quick info log."""
-    get_logger(module).info(message)
+    _cached_logger(module).info(message, *args)
 
 
-def warning(message: str, module: str = "game"):
+def warning(message: str, *args, module: str = "game"):
     """Quick warning log."""
-    get_logger(module).warning(message)
+    _cached_logger(module).warning(message, *args)
 
 
-def error(message: str, module: str = "game", exc_info: bool = False):
+def error(message: str, *args, module: str = "game", exc_info: bool = False):
     """Quick error log."""
-    get_logger(module).error(message, exc_info=exc_info)
+    _cached_logger(module).error(message, *args, exc_info=exc_info)
 
 
-def critical(message: str, module: str = "game", exc_info: bool = False):
+def critical(message: str, *args, module: str = "game", exc_info: bool = False):
     """Quick critical log."""
-    get_logger(module).critical(message, exc_info=exc_info)
+    _cached_logger(module).critical(message, *args, exc_info=exc_info)
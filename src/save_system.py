@@ -461,7 +461,7 @@ def apply_save_data(save_data: dict, player: entities.Entity, world) -> tuple:
 
         # Restore inventory with error handling
         inv_list = player_data.get("inventory", [])
-        player.inventory = []
+        player.inventory = items.ItemList()
         failed_items = 0
 
         for entry in inv_list:
@@ -8,10 +8,13 @@ import pygame
 from ..constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from .. import equipment as equip_mod
 from .. import factions as factions_mod
+from .. import items_batch
 
 
 # Shop state storage (attached to function to persist between calls)
 _shop_items = None
+# Array view over _shop_items; prices are recomputed in one batch when the stock changes
+_shop_view = None
 
 
 def draw_shop_screen(screen, player, events, current_faction_id, show_notification_callback):
@@ -28,7 +31,7 @@ def draw_shop_screen(screen, player, events, current_faction_id, show_notificati
     Returns:
         str: Next state ("OVERWORLD" if exiting, "SHOP_MENU" to stay)
     """
-    global _shop_items
+    global _shop_items, _shop_view
 
     screen.fill((28, 18, 18))
     font_title = pygame.font.Font(None, 48)
@@ -70,14 +73,18 @@ def draw_shop_screen(screen, player, events, current_faction_id, show_notificati
             _shop_items = equip_mod.get_random_shop_inventory(12, faction_id=current_faction_id)
         except Exception:
             _shop_items = equip_mod.get_random_shop_inventory()
+        _shop_view = None
 
     shop_items = _shop_items
+    if _shop_view is None:
+        _shop_view = items_batch.InventoryView(shop_items)
+    prices = _shop_view.values()
     item_y = 120
     for i, item in enumerate(shop_items):
         if not item:
             continue
 
-        item_text = f"{i+1}. {item.get_display_name()} - {item.get_value()} Gold"
+        item_text = f"{i+1}. {item.get_display_name()} - {prices[i]} Gold"
         screen.blit(font_item.render(item_text, True, (220, 220, 220)), (100, item_y + i * 40))
 
     # Instructions
@@ -114,5 +121,6 @@ def draw_shop_screen(screen, player, events, current_faction_id, show_notificati
 
 def reset_shop():
     """Reset shop inventory (call when player leaves shop)."""
-    global _shop_items
+    global _shop_items, _shop_view
     _shop_items = None
+    _shop_view = None
@@ -410,7 +410,7 @@ class World:
                 e.pos = [self.rng.randint(50, WORLD_WIDTH - 50), self.rng.randint(50, WORLD_HEIGHT - 50)]
                 is_safe_spawn = True
                 for loc in self.locations:
-                    if loc.faction == "greeks" and loc.distance_to(e) < 400:
+                    if loc.faction == "greeks" and loc.distance_sq_to(e) < 400 * 400:
                         is_safe_spawn = False
                         break
                 if is_safe_spawn:
@@ -476,6 +476,7 @@ class World:
             e.pos = [self.rng.randint(200, WORLD_WIDTH - 200), self.rng.randint(200, WORLD_HEIGHT - 200)]
             e.faction = 'monsters'
             e.enemy_type = name.lower()
+            e._enemy_type_lc = e.enemy_type
             # Set archetype for sprite selection when available
             if name.lower() == 'minotaur':
                 e.archetype = 'minotaur'
@@ -502,6 +503,7 @@ class World:
             e.pos = [max(50, min(WORLD_WIDTH - 50, sx)), max(50, min(WORLD_HEIGHT - 50, sy))]
             e.faction = 'monsters'
             e.enemy_type = 'minotaur'
+            e._enemy_type_lc = e.enemy_type
             e.archetype = 'minotaur'
             e.stats.hp_max = 380
             e.stats.hp = 380
@@ -557,7 +559,7 @@ def update_world(world: World, player: entities.Entity, dt: float, relations: Op
             world._auto_resolve_timer = 0.0
             # Pre-filter armies near player to reduce iterations
             all_armies = [ee for ee in world.enemies if getattr(ee, 'is_army', False)]
-            armies = [a for a in all_armies if entities.distance(a, player) <= 1400]
+            armies = [a for a in all_armies if entities.dist_sq(a, player) <= 1400 * 1400]
 
             checks = 0
             # Only check armies that are reasonably close to each other
@@ -654,7 +656,7 @@ def update_world(world: World, player: entities.Entity, dt: float, relations: Op
                     e.chase_alert_cooldown = 2.0  # Can alert nearby enemies
                     # Alert nearby enemies to also chase (pack behavior)
                     for ally in world.enemies:
-                        if ally.id != e.id and entities.distance(ally, e) < 200:
+                        if ally.id != e.id and entities.dist_sq(ally, e) < 200 * 200:
                             if hasattr(ally, 'ai_state'):
                                 ally.ai_state = "CHASING"
                 else:
@@ -782,7 +784,7 @@ def update_world(world: World, player: entities.Entity, dt: float, relations: Op
                 if e in world.enemies:
                     world.enemies.remove(e)
             else:
-                nearby = [ee for ee in world.enemies if entities.distance(ee, player) < 250 and ee.id != e.id][:4]
+                nearby = [ee for ee in world.enemies if entities.dist_sq(ee, player) < 250 * 250 and ee.id != e.id][:4]
                 enemies_in_encounter = [e] + nearby
             print(f"[WORLD DEBUG] Collision detected! Creating encounter with {len(enemies_in_encounter)} enemies")
             for ee in enemies_in_encounter:
@@ -796,7 +798,7 @@ def update_world(world: World, player: entities.Entity, dt: float, relations: Op
                 try:
                     af = getattr(ally, 'faction', None)
                     if af and relations and hasattr(relations, 'relations'):
-                        if relations.relations.get(af, 0) > 30 and entities.distance(ally, player) < 320:
+                        if relations.relations.get(af, 0) > 30 and entities.dist_sq(ally, player) < 320 * 320:
                             ally_troops.append(ally)
                             world.enemies.remove(ally)
                 except Exception:
@@ -806,7 +808,7 @@ def update_world(world: World, player: entities.Entity, dt: float, relations: Op
             try:
                 for opp in list(world.enemies):
                     of = getattr(opp, 'faction', None)
-                    if of and of != fac and tuple(sorted((fac, of))) in world.ai_wars and entities.distance(opp, player) < 380:
+                    if of and of != fac and tuple(sorted((fac, of))) in world.ai_wars and entities.dist_sq(opp, player) < 380 * 380:
                         # Expand opp army into soldiers
                         if getattr(opp, 'is_army', False):
                             count_b = max(1, min(10, int(getattr(opp, 'army_size', 1))))
@@ -847,7 +849,7 @@ def update_world(world: World, player: entities.Entity, dt: float, relations: Op
             for e in world.enemies:
                 if getattr(e, 'is_army', False):
                     global_armies += 1
-                if getattr(e, 'faction', None) == c.faction and entities.distance(e, c) < 600 and getattr(e, 'is_army', False):
+                if getattr(e, 'faction', None) == c.faction and entities.dist_sq(e, c) < 600 * 600 and getattr(e, 'is_army', False):
                     nearby += 1
             if nearby < cap and global_armies < getattr(world, '_global_army_cap', 120):
                 # Spawn a single army marker per tick until cap
@@ -948,14 +950,14 @@ def render_world(screen: pygame.Surface, world: World, player: entities.Entity,
             # Faction banner for castles
             if loc.location_type == "castle":
                 try:
-                    fac = factions.get_faction(loc.faction)
-                    if fac and "palette" in fac:
-                        col = fac["palette"].get("primary", (150,150,150))
+                    fac = factions.FACTION_VIEWS.get(loc.faction)
+                    if fac:
+                        col = fac.primary or (150,150,150)
                         # Small banner rectangle above the name
                         banner = pygame.Rect(pos[0]-10, pos[1]-40, 20, 6)
                         pygame.draw.rect(screen, col, banner)
                         # Optional icon/letters
-                        icon_text = fac.get("icon", "")
+                        icon_text = fac.icon
                         if icon_text:
                             icon_font = get_font(16)
                             icon_surf = icon_font.render(str(icon_text), True, (240,240,240))
@@ -965,60 +967,64 @@ def render_world(screen: pygame.Surface, world: World, player: entities.Entity,
 
     # Draw enemies
     mouse_pos = pygame.mouse.get_pos()
-    for e in world.enemies:
-        if world.camera.is_visible(e.pos):
-            pos = world.camera.world_to_screen(e.pos)
-            vfx.draw_entity_shadow(screen, pos, e.radius)
+    # Cull against the camera with the bounds hoisted out of the loop (same
+    # test as Camera.is_visible, in world coordinates)
+    cam = world.camera
+    left, top = -50 - cam.camera.x, -50 - cam.camera.y
+    right, bottom = cam.width + 50 - cam.camera.x, cam.height + 50 - cam.camera.y
+    for e in [e for e in world.enemies if left < e.pos[0] < right and top < e.pos[1] < bottom]:
+        pos = world.camera.world_to_screen(e.pos)
+        vfx.draw_entity_shadow(screen, pos, e.radius)
+
+        # Choose color by faction palette if available
+        base_color = (220, 80, 80)
+        try:
+            fac_id = getattr(e, 'faction', None)
+            if fac_id:
+                fac = factions.FACTION_VIEWS.get(fac_id)
+                if fac and fac.primary:
+                    base_color = fac.primary
+        except Exception:
+            pass
 
-            # Choose color by faction palette if available
-            base_color = (220, 80, 80)
+        # Show different color when chasing (lighter ring)
+        if hasattr(e, 'ai_state') and e.ai_state == "CHASING":
+            pygame.draw.circle(screen, (min(base_color[0]+40,255), min(base_color[1]+40,255), min(base_color[2]+40,255)), pos, int(e.radius)+2, 2)
+        pygame.draw.circle(screen, base_color, pos, int(e.radius))
+        # If this is an army marker, draw the size
+        if getattr(e, 'is_army', False):
             try:
-                fac_id = getattr(e, 'faction', None)
-                if fac_id:
-                    fac = factions.get_faction(fac_id)
-                    if fac and "palette" in fac:
-                        base_color = fac["palette"].get("primary", base_color)
+                font_army = get_font(18)
+                num = int(getattr(e, 'army_size', 1))
+                num_surf = font_army.render(str(num), True, (255,255,255))
+                screen.blit(num_surf, (pos[0] - num_surf.get_width()//2, pos[1] - int(e.radius) - 12))
             except Exception:
                 pass
-
-            # Show different color when chasing (lighter ring)
-            if hasattr(e, 'ai_state') and e.ai_state == "CHASING":
-                pygame.draw.circle(screen, (min(base_color[0]+40,255), min(base_color[1]+40,255), min(base_color[2]+40,255)), pos, int(e.radius)+2, 2)
+            pygame.draw.circle(screen, (255, 200, 0), pos, int(e.radius) + 3, 2)
+            # Tooltip on hover: Faction + Size
+            try:
+                dx = mouse_pos[0] - pos[0]
+                dy = mouse_pos[1] - pos[1]
+                if (dx*dx + dy*dy) <= (max(12, int(e.radius) + 6) ** 2):
+                    fac = getattr(e, 'faction', '') or ''
+                    fac_name = fac
+                    try:
+                        fobj = factions.FACTION_VIEWS.get(fac)
+                        if fobj:
+                            fac_name = fobj.name
+                    except Exception:
+                        pass
+                    tip = f"{fac_name} — {int(getattr(e,'army_size',1))}"
+                    tip_font = get_font(18)
+                    ts = tip_font.render(tip, True, (255,255,255))
+                    bg = pygame.Surface((ts.get_width()+8, ts.get_height()+6), pygame.SRCALPHA)
+                    bg.fill((10,10,10,200))
+                    screen.blit(bg, (pos[0]+12, pos[1]-ts.get_height()-18))
+                    screen.blit(ts, (pos[0]+16, pos[1]-ts.get_height()-16))
+            except Exception:
+                pass
+        else:
             pygame.draw.circle(screen, base_color, pos, int(e.radius))
-            # If this is an army marker, draw the size
-            if getattr(e, 'is_army', False):
-                try:
-                    font_army = get_font(18)
-                    num = int(getattr(e, 'army_size', 1))
-                    num_surf = font_army.render(str(num), True, (255,255,255))
-                    screen.blit(num_surf, (pos[0] - num_surf.get_width()//2, pos[1] - int(e.radius) - 12))
-                except Exception:
-                    pass
-                pygame.draw.circle(screen, (255, 200, 0), pos, int(e.radius) + 3, 2)
-                # Tooltip on hover: Faction + Size
-                try:
-                    dx = mouse_pos[0] - pos[0]
-                    dy = mouse_pos[1] - pos[1]
-                    if (dx*dx + dy*dy) <= (max(12, int(e.radius) + 6) ** 2):
-                        fac = getattr(e, 'faction', '') or ''
-                        fac_name = fac
-                        try:
-                            fobj = factions.get_faction(fac)
-                            if fobj:
-                                fac_name = fobj.get('name', fac)
-                        except Exception:
-                            pass
-                        tip = f"{fac_name} — {int(getattr(e,'army_size',1))}"
-                        tip_font = get_font(18)
-                        ts = tip_font.render(tip, True, (255,255,255))
-                        bg = pygame.Surface((ts.get_width()+8, ts.get_height()+6), pygame.SRCALPHA)
-                        bg.fill((10,10,10,200))
-                        screen.blit(bg, (pos[0]+12, pos[1]-ts.get_height()-18))
-                        screen.blit(ts, (pos[0]+16, pos[1]-ts.get_height()-16))
-                except Exception:
-                    pass
-            else:
-                pygame.draw.circle(screen, base_color, pos, int(e.radius))
 
     # Draw troops (DISABLED - Mount & Blade style: troops only visible in battle)
     # for t in troops:
@@ -1057,9 +1063,9 @@ def render_minimap(screen: pygame.Surface, world: World, player: entities.Entity
         # Override castle color by faction palette if available
         if loc.location_type == "castle":
             try:
-                fac = factions.get_faction(loc.faction)
-                if fac and "palette" in fac:
-                    color = fac["palette"].get("primary", color)
+                fac = factions.FACTION_VIEWS.get(loc.faction)
+                if fac and fac.primary:
+                    color = fac.primary
             except Exception:
                 pass
         pygame.draw.circle(screen, color, pos, 3)
@@ -1094,9 +1100,9 @@ def render_minimap(screen: pygame.Surface, world: World, player: entities.Entity
         try:
             fac_id = getattr(e, 'faction', None)
             if fac_id:
-                fac = factions.get_faction(fac_id)
-                if fac and "palette" in fac:
-                    color = fac["palette"].get("primary", color)
+                fac = factions.FACTION_VIEWS.get(fac_id)
+                if fac and fac.primary:
+                    color = fac.primary
         except Exception:
             pass
         pygame.draw.circle(screen, color, pos, 1)
@@ -1163,9 +1169,9 @@ def render_world_map(screen: pygame.Surface, world: World, player: entities.Enti
         # Color by faction palette primary
         col = (180, 180, 180)
         try:
-            fac = factions.get_faction(getattr(loc, 'faction', None))
-            if fac and 'palette' in fac:
-                col = fac['palette'].get('primary', col)
+            fac = factions.FACTION_VIEWS.get(getattr(loc, 'faction', None))
+            if fac and fac.primary:
+                col = fac.primary
         except Exception:
             pass
         pygame.draw.circle(screen, col, pos, 5)